@@ -7,17 +7,29 @@ functionality of ODR-DabMux.
 import logging
 import structlog
 
-# Configure structlog for clean, structured logging
-structlog.configure(
-    processors=[
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.add_log_level,
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
-    context_class=dict,
-    logger_factory=structlog.PrintLoggerFactory(),
-)
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure structlog for clean, structured logging.
+
+    Called from the CLI entry point rather than at import time, so that
+    importing dabmux submodules stays cheap and library users keep
+    their own structlog configuration.
+
+    Args:
+        level: Minimum log level to emit
+    """
+    structlog.configure(
+        processors=[
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.add_log_level,
+            structlog.dev.ConsoleRenderer()
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        context_class=dict,
+        logger_factory=structlog.PrintLoggerFactory(),
+    )
+
 
 logger = structlog.get_logger()
 
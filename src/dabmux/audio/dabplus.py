@@ -5,10 +5,32 @@ This module provides infrastructure for DAB+ subchannels, including
 superframe handling and configuration. Full HE-AAC encoding is not
 implemented (would require external encoder like fdk-aac).
 """
+import re
+from functools import lru_cache
 from dataclasses import dataclass
 from enum import Enum
 from typing import Optional
 
+# Bitrate strings like "64", "64k", "64kbps" (any case, optional whitespace)
+_BITRATE_RE = re.compile(r'^\s*(\d+)\s*(?:kbps|k)?\s*$', re.IGNORECASE)
+
+# Common DAB+ bitrates (kbps)
+_VALID_DABPLUS_BITRATES = frozenset(
+    {8, 16, 24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 112, 128, 144, 160, 192}
+)
+
+
+@lru_cache(maxsize=None)
+def _superframe_size_for_bitrate(bitrate: int) -> int:
+    """
+    Superframe size in bytes for a bitrate in kbps (RS enabled).
+
+    Pure function of bitrate, so results are cached for the handful of
+    bitrates a running mux actually uses.
+    """
+    base_size = 5 * bitrate * 3
+    return base_size + -(-base_size // 110) * 10
+
 
 class DabPlusProfile(Enum):
     """DAB+ audio profile."""
@@ -16,7 +38,7 @@ class DabPlusProfile(Enum):
     HE_AAC_V2 = "he-aac-v2"  # HE-AAC v2 (AAC+SBR+PS)
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPlusSuperframe:
     """
     DAB+ Superframe structure.
@@ -44,15 +66,16 @@ class DabPlusSuperframe:
 
         # Add RS parity if enabled
         if self.rs_enabled:
-            # RS adds 10 parity bytes per 110 bytes (or 120 bytes)
-            # Simplified calculation
-            rs_overhead = (base_size // 110) * 10
+            # RS(120, 110) adds 10 parity bytes per 110 data bytes;
+            # a partial final block still gets a full parity block,
+            # hence the ceiling division
+            rs_overhead = -(-base_size // 110) * 10
             return base_size + rs_overhead
 
         return base_size
 
 
-@dataclass
+@dataclass(slots=True)
 class DabPlusConfig:
     """
     DAB+ subchannel configuration.
@@ -85,12 +108,7 @@ class DabPlusConfig:
         Returns:
             Superframe size in bytes
         """
-        superframe = DabPlusSuperframe(
-            num_aus=5,
-            au_size=self.get_au_size(),
-            rs_enabled=True
-        )
-        return superframe.get_total_size()
+        return _superframe_size_for_bitrate(self.bitrate)
 
     def requires_enhanced_packet_mode(self) -> bool:
         """
@@ -155,17 +173,14 @@ def parse_dabplus_bitrate(bitrate_str: str) -> int:
     Raises:
         ValueError: If bitrate string is invalid
     """
-    # Remove common suffixes
-    bitrate_str = bitrate_str.lower().replace('kbps', '').replace('k', '').strip()
-
-    try:
-        bitrate = int(bitrate_str)
-    except ValueError:
+    match = _BITRATE_RE.match(bitrate_str)
+    if not match:
         raise ValueError(f"Invalid bitrate string: {bitrate_str}")
 
+    bitrate = int(match.group(1))
+
     # Validate common DAB+ bitrates
-    valid_bitrates = [8, 16, 24, 32, 40, 48, 56, 64, 72, 80, 88, 96, 112, 128, 144, 160, 192]
-    if bitrate not in valid_bitrates:
+    if bitrate not in _VALID_DABPLUS_BITRATES:
         raise ValueError(f"Unsupported DAB+ bitrate: {bitrate} kbps")
 
     return bitrate
@@ -4,14 +4,72 @@ MPEG audio frame parsing and validation.
 This module implements MPEG Layer I/II audio frame header parsing,
 validation, and frame length calculation.
 """
-import struct
+import re
+from array import array
 from enum import IntEnum
+from functools import lru_cache
 from dataclasses import dataclass
 from typing import Optional, Tuple
 import structlog
 
 logger = structlog.get_logger()
 
+# Layer II bitrate table (kbps), packed as one contiguous array:
+# MPEG-1 entries at [bitrate_index], MPEG-2 at [16 + bitrate_index]
+_BITRATE_KBPS = array('H', [
+    0, 32, 48, 56, 64, 80, 96, 112,
+    128, 160, 192, 224, 256, 320, 384, 0,
+    0, 8, 16, 24, 32, 40, 48, 56,
+    64, 80, 96, 112, 128, 144, 160, 0,
+])
+
+# Sampling rate table (Hz): MPEG-1 entries at [sampling_rate_index],
+# MPEG-2 at [4 + sampling_rate_index]
+_SAMPLE_RATE_HZ = array('I', [
+    44100, 48000, 32000, 0,
+    22050, 24000, 16000, 0,
+])
+
+# Sync candidate: 0xFF followed by a byte with the top three bits set.
+# The lookahead keeps matches one byte long so overlapping candidates
+# (e.g. runs of 0xFF) are all examined.
+_SYNC_CANDIDATE_RE = re.compile(rb'\xff(?=[\xe0-\xff])')
+
+
+@lru_cache(maxsize=64)
+def _frame_length_for_header(header_int: int) -> int:
+    """
+    Frame length in bytes for a packed 32-bit MPEG header.
+
+    A CBR stream carries only a handful of distinct headers, so the
+    cache saturates after the first few frames and subsequent lookups
+    avoid the table reads and division entirely.
+
+    Args:
+        header_int: Big-endian packed 4-byte header
+
+    Returns:
+        Frame length in bytes, or 0 if invalid
+    """
+    version = (header_int >> 19) & 0x03
+    layer = (header_int >> 17) & 0x03
+    bitrate_index = (header_int >> 12) & 0x0F
+    sampling_rate_index = (header_int >> 10) & 0x03
+    padding = (header_int >> 9) & 0x01
+
+    if layer != MpegLayer.LAYER_II:
+        return 0
+
+    base = 0 if version == 3 else 16  # MPEG-1 vs MPEG-2 halves
+    bitrate = _BITRATE_KBPS[base + bitrate_index]
+    sampling_rate = _SAMPLE_RATE_HZ[(base >> 2) + sampling_rate_index]
+
+    if bitrate == 0 or sampling_rate == 0:
+        return 0
+
+    # Layer II: 144 * bitrate / sampling_rate + padding
+    return (144 * bitrate * 1000) // sampling_rate + padding
+
 
 class MpegLayer(IntEnum):
     """MPEG audio layer."""
@@ -28,7 +86,7 @@ class MpegSamplingRate(IntEnum):
     RATE_16000 = 16000
 
 
-@dataclass
+@dataclass(slots=True)
 class MpegHeader:
     """
     MPEG audio frame header.
@@ -48,6 +106,7 @@ class MpegHeader:
     copyright: int = 0       # Copyright bit (1 bit)
     original: int = 0        # Original bit (1 bit)
     emphasis: int = 0        # Emphasis (2 bits)
+    raw: int = 0             # Packed 32-bit header (0 if built by hand)
 
     def is_valid(self) -> bool:
         """
@@ -85,23 +144,9 @@ class MpegHeader:
         Returns:
             Bitrate in kbps, or 0 if invalid
         """
-        # MPEG-1 Layer II bitrate table
-        mpeg1_layer2_bitrates = [
-            0, 32, 48, 56, 64, 80, 96, 112,
-            128, 160, 192, 224, 256, 320, 384, 0
-        ]
-
-        # MPEG-2 Layer II bitrate table
-        mpeg2_layer2_bitrates = [
-            0, 8, 16, 24, 32, 40, 48, 56,
-            64, 80, 96, 112, 128, 144, 160, 0
-        ]
-
         if self.layer == MpegLayer.LAYER_II:
-            if self.version == 3:  # MPEG-1
-                return mpeg1_layer2_bitrates[self.bitrate_index]
-            else:  # MPEG-2
-                return mpeg2_layer2_bitrates[self.bitrate_index]
+            base = 0 if self.version == 3 else 16  # MPEG-1 vs MPEG-2
+            return _BITRATE_KBPS[base + self.bitrate_index]
 
         return 0
 
@@ -112,16 +157,8 @@ class MpegHeader:
         Returns:
             Sampling rate in Hz, or 0 if invalid
         """
-        # MPEG-1 sampling rates
-        mpeg1_rates = [44100, 48000, 32000, 0]
-
-        # MPEG-2 sampling rates (half of MPEG-1)
-        mpeg2_rates = [22050, 24000, 16000, 0]
-
-        if self.version == 3:  # MPEG-1
-            return mpeg1_rates[self.sampling_rate_index]
-        else:  # MPEG-2
-            return mpeg2_rates[self.sampling_rate_index]
+        base = 0 if self.version == 3 else 4  # MPEG-1 vs MPEG-2
+        return _SAMPLE_RATE_HZ[base + self.sampling_rate_index]
 
     def get_frame_length(self) -> int:
         """
@@ -133,6 +170,10 @@ class MpegHeader:
         Returns:
             Frame length in bytes
         """
+        if self.raw:
+            # Headers parsed from the wire hit the shared cache
+            return _frame_length_for_header(self.raw)
+
         bitrate = self.get_bitrate()
         sampling_rate = self.get_sampling_rate()
 
@@ -177,8 +218,9 @@ class MpegFrameParser:
         if len(data) < 4:
             return None
 
-        # Unpack as big-endian 32-bit integer
-        header_int = struct.unpack('>I', data[:4])[0]
+        # Unpack as big-endian 32-bit integer (int.from_bytes is faster
+        # than struct.unpack for a single 4-byte read)
+        header_int = int.from_bytes(data[:4], 'big')
 
         header = MpegHeader()
 
@@ -196,9 +238,38 @@ class MpegFrameParser:
         header.copyright = (header_int >> 3) & 0x01
         header.original = (header_int >> 2) & 0x01
         header.emphasis = header_int & 0x03
+        header.raw = header_int
 
         return header
 
+    @staticmethod
+    def _fast_prevalidate(header_int: int) -> bool:
+        """
+        Check DAB validity of a packed 32-bit header without building
+        an MpegHeader.
+
+        Mirrors MpegHeader.is_valid() so the sync-search loop only
+        constructs a dataclass for headers that will actually be used.
+
+        Args:
+            header_int: Big-endian packed 4-byte header
+
+        Returns:
+            True if the packed header passes all validity checks
+        """
+        if (header_int >> 21) & 0x7FF != 0x7FF:
+            return False
+        if (header_int >> 19) & 0x03 not in (2, 3):
+            return False
+        if (header_int >> 17) & 0x03 == 0:
+            return False
+        bitrate_index = (header_int >> 12) & 0x0F
+        if bitrate_index == 0 or bitrate_index == 15:
+            return False
+        if (header_int >> 10) & 0x03 == 3:
+            return False
+        return True
+
     def find_sync(self, data: bytes, max_search: int = MAX_SYNC_SEARCH) -> Optional[int]:
         """
         Find MPEG sync word in data.
@@ -213,35 +284,46 @@ class MpegFrameParser:
             Offset of sync word, or None if not found
         """
         search_len = min(len(data) - 3, max_search)
+        if search_len <= 0:
+            return None
 
-        for i in range(search_len):
-            # Check for sync word (11 bits set)
-            if data[i] == 0xFF and (data[i + 1] & 0xE0) == 0xE0:
-                # Found potential sync, validate header
-                header = self.parse_header(data[i:i + 4])
-                if header and header.is_valid():
-                    return i
+        # The compiled regex scans for both sync bytes in one C-level
+        # pass; only the handful of real candidates reach Python, where
+        # the packed-int check rejects them before any MpegHeader is
+        # constructed.
+        for match in _SYNC_CANDIDATE_RE.finditer(data, 0, search_len + 1):
+            i = match.start()
+            if self._fast_prevalidate(int.from_bytes(data[i:i + 4], 'big')):
+                return i
 
         return None
 
-    def read_frame(self, data: bytes) -> Optional[Tuple[MpegHeader, bytes]]:
+    def _locate_frame(self, data: bytes) -> Optional[Tuple[MpegHeader, int, int]]:
         """
-        Read next MPEG frame from data.
+        Locate the next MPEG frame without extracting its data.
 
         Args:
             data: Data to read from
 
         Returns:
-            Tuple of (header, frame_data) or None if no valid frame found
+            Tuple of (header, sync_offset, frame_length) or None if no
+            valid frame found
         """
-        # Find sync word
-        sync_offset = self.find_sync(data)
+        # Fast path for contiguous CBR streams: after one frame has been
+        # read, the next call usually starts exactly on the next sync,
+        # so skip the scan when offset 0 already validates.
+        if (self.last_header is not None and len(data) >= 4
+                and self._fast_prevalidate(int.from_bytes(data[:4], 'big'))):
+            sync_offset = 0
+        else:
+            # Find sync word
+            sync_offset = self.find_sync(data)
         if sync_offset is None:
             logger.debug("No MPEG sync found")
             return None
 
         # Parse header
-        header = self.parse_header(data[sync_offset:])
+        header = self.parse_header(data[sync_offset:sync_offset + 4])
         if not header or not header.is_valid():
             logger.debug("Invalid MPEG header")
             return None
@@ -261,8 +343,31 @@ class MpegFrameParser:
             )
             return None
 
-        # Extract frame data
-        frame_data = data[sync_offset:sync_offset + frame_length]
+        self.last_header = header
+        return (header, sync_offset, frame_length)
+
+    def read_frame(self, data: bytes) -> Optional[Tuple[MpegHeader, memoryview]]:
+        """
+        Read next MPEG frame from data.
+
+        The frame is returned as a zero-copy view into ``data``; callers
+        that keep the frame beyond the lifetime of the input buffer must
+        copy it with ``bytes()``.
+
+        Args:
+            data: Data to read from
+
+        Returns:
+            Tuple of (header, frame_view) or None if no valid frame found
+        """
+        located = self._locate_frame(data)
+        if located is None:
+            return None
+
+        header, sync_offset, frame_length = located
+
+        # Zero-copy view of the frame data
+        frame_data = memoryview(data)[sync_offset:sync_offset + frame_length]
 
         # Validate next frame sync (if available)
         next_offset = sync_offset + frame_length
@@ -271,7 +376,6 @@ class MpegFrameParser:
             if next_sync != 0:
                 logger.warning("Next frame sync not at expected position")
 
-        self.last_header = header
         return (header, frame_data)
 
     def validate_frame(self, data: bytes) -> bool:
@@ -307,16 +411,17 @@ class MpegFrameParser:
         Returns:
             Dictionary with frame info, or None if invalid
         """
-        result = self.read_frame(data)
-        if not result:
+        located = self._locate_frame(data)
+        if not located:
             return None
 
-        header, frame_data = result
+        # Header-only pass: never slice out the frame bytes
+        header, _, frame_length = located
 
         return {
             'bitrate': header.get_bitrate(),
             'sampling_rate': header.get_sampling_rate(),
-            'frame_length': len(frame_data),
+            'frame_length': frame_length,
             'layer': header.layer.name,
             'version': 1 if header.version == 3 else 2,
             'protected': header.protection == 0,
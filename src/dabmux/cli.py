@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import Optional
 import structlog
 
+from dabmux import configure_logging
 from dabmux.config import load_config
 from dabmux.mux import DabMultiplexer
 from dabmux.output.file import FileOutput, EtiFileType
@@ -492,6 +493,7 @@ def main() -> int:
     Returns:
         Exit code
     """
+    configure_logging()
     cli = DabMuxCLI()
     return cli.run()
 
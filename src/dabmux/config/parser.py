@@ -3,9 +3,15 @@ Configuration file parser for DAB multiplexer.
 
 Supports YAML configuration files for defining ensembles, services, and subchannels.
 """
+import copy
 import yaml
+try:
+    # libyaml-backed parser, 5-10x faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from dabmux.core.mux_elements import (
     DabEnsemble,
     DabService,
@@ -28,6 +34,51 @@ from dabmux.core.mux_elements import (
 )
 
 
+def _coerce_int(value: Any, default: int = 0) -> int:
+    """
+    Coerce a config value to int, accepting hex ('0x...') or decimal strings.
+
+    Args:
+        value: Raw value from the configuration
+        default: Value returned when the input is None
+
+    Returns:
+        Integer value
+    """
+    if value is None:
+        return default
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value, 16) if value.startswith(('0x', '0X')) else int(value)
+    return int(value)
+
+
+# Transmission mode names accepted in configuration files
+_MODE_MAP = {
+    'I': TransmissionMode.TM_I, 'II': TransmissionMode.TM_II,
+    'III': TransmissionMode.TM_III, 'IV': TransmissionMode.TM_IV,
+    '1': TransmissionMode.TM_I, '2': TransmissionMode.TM_II,
+    '3': TransmissionMode.TM_III, '4': TransmissionMode.TM_IV
+}
+
+# Subchannel type names accepted in configuration files
+_SUBCHANNEL_TYPE_MAP = {
+    'audio': SubchannelType.DABAudio,
+    'dab': SubchannelType.DABAudio,
+    'dabplus': SubchannelType.DABPlusAudio,
+    'dab+': SubchannelType.DABPlusAudio,
+    'packet': SubchannelType.Packet,
+    'data': SubchannelType.Packet,
+    'dmb': SubchannelType.DataDmb
+}
+
+# Parsed-config cache: resolved path -> (mtime, size, ensemble).
+# Long-lived services reload config on signal; most reloads see an
+# unchanged file, so skip the YAML parse and object-graph rebuild.
+_CONFIG_CACHE: Dict[str, Tuple[float, int, DabEnsemble]] = {}
+
+
 class ConfigParser:
     """
     Parse YAML configuration files for DAB multiplexer.
@@ -52,10 +103,19 @@ class ConfigParser:
         if not path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
+        stat = path.stat()
+        cache_key = str(path.resolve())
+        cached = _CONFIG_CACHE.get(cache_key)
+        if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+            # Unchanged file: hand out a copy so callers can mutate freely
+            return copy.deepcopy(cached[2])
+
         with open(path, 'r') as f:
-            config = yaml.safe_load(f)
+            config = yaml.load(f, Loader=_YamlLoader)
 
-        return ConfigParser.parse_dict(config)
+        ensemble = ConfigParser.parse_dict(config)
+        _CONFIG_CACHE[cache_key] = (stat.st_mtime, stat.st_size, copy.deepcopy(ensemble))
+        return ensemble
 
     @staticmethod
     def parse_dict(config: Dict[str, Any]) -> DabEnsemble:
@@ -77,21 +137,12 @@ class ConfigParser:
         ensemble_config = config['ensemble']
 
         # Parse ensemble parameters
-        ens_id = ensemble_config.get('id', 0)
-        if isinstance(ens_id, str):
-            ens_id = int(ens_id, 16) if ens_id.startswith('0x') else int(ens_id)
-
-        ecc = ensemble_config.get('ecc', 0xE1)
-        if isinstance(ecc, str):
-            ecc = int(ecc, 16) if ecc.startswith('0x') else int(ecc)
+        ens_id = _coerce_int(ensemble_config.get('id', 0))
+        ecc = _coerce_int(ensemble_config.get('ecc', 0xE1))
 
         # Parse transmission mode
         mode_str = ensemble_config.get('transmission_mode', 'I')
-        mode_map = {'I': TransmissionMode.TM_I, 'II': TransmissionMode.TM_II,
-                    'III': TransmissionMode.TM_III, 'IV': TransmissionMode.TM_IV,
-                    '1': TransmissionMode.TM_I, '2': TransmissionMode.TM_II,
-                    '3': TransmissionMode.TM_III, '4': TransmissionMode.TM_IV}
-        transmission_mode = mode_map.get(mode_str.upper(), TransmissionMode.TM_I)
+        transmission_mode = _MODE_MAP.get(mode_str.upper(), TransmissionMode.TM_I)
 
         # Parse ensemble label (handle both inline and separate short_label)
         label_config = ensemble_config.get('label', {})
@@ -132,17 +183,9 @@ class ConfigParser:
         # Parse other ensemble services (FIG 0/24)
         if 'other_ensemble_services' in ensemble_config:
             for oe_svc_dict in ensemble_config['other_ensemble_services']:
-                oe_ecc = oe_svc_dict.get('ecc', 0)
-                if isinstance(oe_ecc, str):
-                    oe_ecc = int(oe_ecc, 16) if oe_ecc.startswith('0x') else int(oe_ecc)
-
-                oe_ens_id = oe_svc_dict.get('ensemble_id', 0)
-                if isinstance(oe_ens_id, str):
-                    oe_ens_id = int(oe_ens_id, 16) if oe_ens_id.startswith('0x') else int(oe_ens_id)
-
-                oe_svc_id = oe_svc_dict.get('service_id', 0)
-                if isinstance(oe_svc_id, str):
-                    oe_svc_id = int(oe_svc_id, 16) if oe_svc_id.startswith('0x') else int(oe_svc_id)
+                oe_ecc = _coerce_int(oe_svc_dict.get('ecc', 0))
+                oe_ens_id = _coerce_int(oe_svc_dict.get('ensemble_id', 0))
+                oe_svc_id = _coerce_int(oe_svc_dict.get('service_id', 0))
 
                 oe_svc = OtherEnsembleService(
                     ecc=oe_ecc,
@@ -271,16 +314,7 @@ class ConfigParser:
         """Parse subchannel configuration."""
         # Parse subchannel type
         type_str = sub_config.get('type', 'audio').lower()
-        type_map = {
-            'audio': SubchannelType.DABAudio,
-            'dab': SubchannelType.DABAudio,
-            'dabplus': SubchannelType.DABPlusAudio,
-            'dab+': SubchannelType.DABPlusAudio,
-            'packet': SubchannelType.Packet,
-            'data': SubchannelType.Packet,
-            'dmb': SubchannelType.DataDmb
-        }
-        subchannel_type = type_map.get(type_str, SubchannelType.DABAudio)
+        subchannel_type = _SUBCHANNEL_TYPE_MAP.get(type_str, SubchannelType.DABAudio)
 
         # Auto-detect type from input URI if type is default 'audio'
         if type_str == 'audio' and 'input_uri' in sub_config:
@@ -389,9 +423,7 @@ class ConfigParser:
     def _parse_service(svc_config: Dict[str, Any]) -> DabService:
         """Parse service configuration."""
         # Parse service ID (support both 'id' and 'sid')
-        svc_id = svc_config.get('sid', svc_config.get('id', 0))
-        if isinstance(svc_id, str):
-            svc_id = int(svc_id, 16) if svc_id.startswith('0x') else int(svc_id)
+        svc_id = _coerce_int(svc_config.get('sid', svc_config.get('id', 0)))
 
         # Parse PTy settings
         pty_settings = PtySettings()
@@ -465,42 +497,22 @@ class ConfigParser:
 
                 # Parse type-specific fields
                 if idlq == 0:  # DAB
-                    target_ecc = link.get('target_ecc', 0)
-                    if isinstance(target_ecc, str):
-                        target_ecc = int(target_ecc, 16) if target_ecc.startswith('0x') else int(target_ecc)
-
-                    target_ens = link.get('target_ensemble', 0)
-                    if isinstance(target_ens, str):
-                        target_ens = int(target_ens, 16) if target_ens.startswith('0x') else int(target_ens)
-
-                    target_svc = link.get('target_service', 0)
-                    if isinstance(target_svc, str):
-                        target_svc = int(target_svc, 16) if target_svc.startswith('0x') else int(target_svc)
-
-                    svc_link.target_ecc = target_ecc
-                    svc_link.target_ensemble_id = target_ens
-                    svc_link.target_service_id = target_svc
+                    svc_link.target_ecc = _coerce_int(link.get('target_ecc', 0))
+                    svc_link.target_ensemble_id = _coerce_int(link.get('target_ensemble', 0))
+                    svc_link.target_service_id = _coerce_int(link.get('target_service', 0))
 
                 elif idlq == 1:  # RDS/FM
                     if 'rds_pi_code' in link:
-                        rds_pi = link['rds_pi_code']
-                        if isinstance(rds_pi, str):
-                            rds_pi = int(rds_pi, 16) if rds_pi.startswith('0x') else int(rds_pi)
-                        svc_link.rds_pi_code = rds_pi
+                        svc_link.rds_pi_code = _coerce_int(link['rds_pi_code'])
                     if 'fm_frequency' in link:
                         svc_link.fm_frequency_mhz = link['fm_frequency']
 
                 elif idlq == 2:  # DRM
-                    drm_sid = link.get('drm_service_id', 0)
-                    if isinstance(drm_sid, str):
-                        drm_sid = int(drm_sid, 16) if drm_sid.startswith('0x') else int(drm_sid)
-                    svc_link.drm_service_id = drm_sid
+                    svc_link.drm_service_id = _coerce_int(link.get('drm_service_id', 0))
 
                 elif idlq == 3:  # AMSS
-                    amss_sid = link.get('amss_service_id', 0)
-                    if isinstance(amss_sid, str):
-                        amss_sid = int(amss_sid, 16) if amss_sid.startswith('0x') else int(amss_sid)
-                    svc_link.drm_service_id = amss_sid  # Reuse drm_service_id field
+                    # Reuse drm_service_id field
+                    svc_link.drm_service_id = _coerce_int(link.get('amss_service_id', 0))
 
                 linkage.links.append(svc_link)
 
@@ -524,9 +536,7 @@ class ConfigParser:
         from dabmux.core.mux_elements import DabPacketComponent, UserApplication
 
         # Parse service and subchannel IDs
-        service_id = comp_config.get('service_id', comp_config.get('service', 0))
-        if isinstance(service_id, str):
-            service_id = int(service_id, 16) if service_id.startswith('0x') else int(service_id)
+        service_id = _coerce_int(comp_config.get('service_id', comp_config.get('service', 0)))
 
         subchannel_id = comp_config.get('subchannel_id', comp_config.get('subchannel', 0))
 
@@ -9,8 +9,30 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import List
 
-
-@dataclass
+from dabmux.utils.crc import crc16
+
+# Compiled layouts, parsed once at import; Struct.pack/unpack skip the
+# per-call format-string parse that plain struct.pack pays
+_U32_BE = struct.Struct('>I')
+_U32_LE = struct.Struct('<I')
+_BBBB = struct.Struct('<BBBB')
+_HH_BE = struct.Struct('>HH')
+_BB = struct.Struct('<BB')
+_U64_BE = struct.Struct('>Q')
+
+# BCD digit tables for values 0..99: one indexed load instead of a
+# divmod-by-10 pair per field in the MNSC time encoders. In CPython an
+# indexed bytes load is also cheaper than the multiply-and-shift
+# reciprocal trick, which only pays off in compiled code.
+_BCD_TENS = bytes(v // 10 for v in range(100))
+_BCD_UNITS = bytes(v % 10 for v in range(100))
+
+# Shared empty FIC section; bytes are immutable so one instance serves
+# every empty frame instead of a fresh 96-byte allocation per call
+_EMPTY_FIC = bytes(96)
+
+
+@dataclass(slots=True)
 class EtiSync:
     """
     ETI SYNC header (4 bytes).
@@ -27,18 +49,23 @@ class EtiSync:
         # ERR is the first byte (MSB), FSYNC is the next 3 bytes
         # Combine: err (bits 24-31) | fsync (bits 0-23)
         value = (self.err << 24) | self.fsync
-        return struct.pack('>I', value)
+        return _U32_BE.pack(value)
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        _U32_BE.pack_into(buf, offset, (self.err << 24) | self.fsync)
+        return offset + 4
 
     @classmethod
     def unpack(cls, data: bytes) -> 'EtiSync':
         """Unpack from 4 bytes (big-endian per ETSI EN 300 799)."""
-        value = struct.unpack('>I', data[:4])[0]
+        value = _U32_BE.unpack(data[:4])[0]
         err = (value >> 24) & 0xFF
         fsync = value & 0xFFFFFF
         return cls(err=err, fsync=fsync)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiFC:
     """
     Frame Characterization (4 bytes).
@@ -67,28 +94,31 @@ class EtiFC:
         """Set combined 11-bit frame length."""
         self.fl = length & 0x7FF
 
-    def pack(self) -> bytes:
-        """Pack to 4 bytes (little-endian)."""
-        # Split FL into high and low
-        fl_high = (self.fl >> 8) & 0x07
-        fl_low = self.fl & 0xFF
-
-        # Pack bitfields into 32 bits
+    def _word(self) -> int:
+        """Fuse all bitfields into one 32-bit little-endian word."""
         # Byte 0: FCT[7:0]
         # Byte 1: FICF[0] NST[6:0]
         # Byte 2: FP[2:0] MID[1:0] FL_high[2:0]
         # Byte 3: FL_low[7:0]
-        byte0 = self.fct & 0xFF
-        byte1 = ((self.ficf & 0x01) << 7) | (self.nst & 0x7F)
-        byte2 = ((self.fp & 0x07) << 5) | ((self.mid & 0x03) << 3) | (fl_high & 0x07)
-        byte3 = fl_low & 0xFF
+        return (self.fct & 0xFF) | \
+               ((self.ficf & 0x01) << 15) | ((self.nst & 0x7F) << 8) | \
+               ((self.fp & 0x07) << 21) | ((self.mid & 0x03) << 19) | \
+               (((self.fl >> 8) & 0x07) << 16) | \
+               ((self.fl & 0xFF) << 24)
+
+    def pack(self) -> bytes:
+        """Pack to 4 bytes (little-endian)."""
+        return _U32_LE.pack(self._word())
 
-        return struct.pack('<BBBB', byte0, byte1, byte2, byte3)
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        _U32_LE.pack_into(buf, offset, self._word())
+        return offset + 4
 
     @classmethod
     def unpack(cls, data: bytes) -> 'EtiFC':
         """Unpack from 4 bytes."""
-        byte0, byte1, byte2, byte3 = struct.unpack('<BBBB', data[:4])
+        byte0, byte1, byte2, byte3 = _BBBB.unpack(data[:4])
 
         fct = byte0
         nst = byte1 & 0x7F
@@ -102,7 +132,7 @@ class EtiFC:
         return cls(fct=fct, nst=nst, ficf=ficf, mid=mid, fp=fp, fl=fl)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiSTC:
     """
     Sub-channel header (4 bytes).
@@ -136,29 +166,30 @@ class EtiSTC:
         """Set combined 10-bit start address."""
         self.start_address = address & 0x3FF
 
-    def pack(self) -> bytes:
-        """Pack to 4 bytes (little-endian)."""
-        # Split combined fields
-        start_addr_high = (self.start_address >> 8) & 0x03
-        start_addr_low = self.start_address & 0xFF
-        stl_high = (self.stl >> 8) & 0x03
-        stl_low = self.stl & 0xFF
-
+    def _word(self) -> int:
+        """Fuse all bitfields into one 32-bit little-endian word."""
         # Byte 0: SCID[5:0] startAddress_high[1:0]
         # Byte 1: startAddress_low[7:0]
         # Byte 2: TPL[5:0] STL_high[1:0]
         # Byte 3: STL_low[7:0]
-        byte0 = ((self.scid & 0x3F) << 2) | (start_addr_high & 0x03)
-        byte1 = start_addr_low & 0xFF
-        byte2 = ((self.tpl & 0x3F) << 2) | (stl_high & 0x03)
-        byte3 = stl_low & 0xFF
+        return ((self.scid & 0x3F) << 2) | ((self.start_address >> 8) & 0x03) | \
+               ((self.start_address & 0xFF) << 8) | \
+               ((self.tpl & 0x3F) << 18) | (((self.stl >> 8) & 0x03) << 16) | \
+               ((self.stl & 0xFF) << 24)
 
-        return struct.pack('<BBBB', byte0, byte1, byte2, byte3)
+    def pack(self) -> bytes:
+        """Pack to 4 bytes (little-endian)."""
+        return _U32_LE.pack(self._word())
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        _U32_LE.pack_into(buf, offset, self._word())
+        return offset + 4
 
     @classmethod
     def unpack(cls, data: bytes) -> 'EtiSTC':
         """Unpack from 4 bytes."""
-        byte0, byte1, byte2, byte3 = struct.unpack('<BBBB', data[:4])
+        byte0, byte1, byte2, byte3 = _BBBB.unpack(data[:4])
 
         start_addr_high = byte0 & 0x03
         scid = (byte0 >> 2) & 0x3F
@@ -173,7 +204,7 @@ class EtiSTC:
         return cls(scid=scid, start_address=start_address, tpl=tpl, stl=stl)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiEOH:
     """
     End of Header (4 bytes).
@@ -187,16 +218,21 @@ class EtiEOH:
 
     def pack(self) -> bytes:
         """Pack to 4 bytes (big-endian for CRC)."""
-        return struct.pack('>HH', self.mnsc, self.crc)
+        return _HH_BE.pack(self.mnsc, self.crc)
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        _HH_BE.pack_into(buf, offset, self.mnsc, self.crc)
+        return offset + 4
 
     @classmethod
     def unpack(cls, data: bytes) -> 'EtiEOH':
         """Unpack from 4 bytes."""
-        mnsc, crc = struct.unpack('>HH', data[:4])
+        mnsc, crc = _HH_BE.unpack(data[:4])
         return cls(mnsc=mnsc, crc=crc)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiEOF:
     """
     End of Frame (4 bytes).
@@ -210,16 +246,21 @@ class EtiEOF:
 
     def pack(self) -> bytes:
         """Pack to 4 bytes (big-endian)."""
-        return struct.pack('>HH', self.crc, self.rfu)
+        return _HH_BE.pack(self.crc, self.rfu)
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        _HH_BE.pack_into(buf, offset, self.crc, self.rfu)
+        return offset + 4
 
     @classmethod
     def unpack(cls, data: bytes) -> 'EtiEOF':
         """Unpack from 4 bytes."""
-        crc, rfu = struct.unpack('>HH', data[:4])
+        crc, rfu = _HH_BE.unpack(data[:4])
         return cls(crc=crc, rfu=rfu)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiTIST:
     """
     Time Stamp (4 bytes).
@@ -231,16 +272,21 @@ class EtiTIST:
 
     def pack(self) -> bytes:
         """Pack to 4 bytes (little-endian)."""
-        return struct.pack('<I', self.tist)
+        return _U32_LE.pack(self.tist)
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        _U32_LE.pack_into(buf, offset, self.tist)
+        return offset + 4
 
     @classmethod
     def unpack(cls, data: bytes) -> 'EtiTIST':
         """Unpack from 4 bytes."""
-        tist = struct.unpack('<I', data[:4])[0]
+        tist = _U32_LE.unpack(data[:4])[0]
         return cls(tist=tist)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiMNSCTime0:
     """
     MNSC Time field 0 (2 bytes).
@@ -258,10 +304,10 @@ class EtiMNSCTime0:
         """Pack to 2 bytes."""
         byte0 = ((self.identifier & 0x0F) << 4) | (self.type & 0x0F)
         byte1 = self.rfa & 0xFF
-        return struct.pack('<BB', byte0, byte1)
+        return _BB.pack(byte0, byte1)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiMNSCTime1:
     """
     MNSC Time field 1 (2 bytes) - Minutes and Seconds in BCD.
@@ -283,19 +329,19 @@ class EtiMNSCTime1:
 
     def set_from_time(self, dt: datetime) -> None:
         """Set from datetime object (BCD encoding)."""
-        self.second_unit = dt.second % 10
-        self.second_tens = dt.second // 10
-        self.minute_unit = dt.minute % 10
-        self.minute_tens = dt.minute // 10
+        self.second_unit = _BCD_UNITS[dt.second]
+        self.second_tens = _BCD_TENS[dt.second]
+        self.minute_unit = _BCD_UNITS[dt.minute]
+        self.minute_tens = _BCD_TENS[dt.minute]
 
     def pack(self) -> bytes:
         """Pack to 2 bytes."""
         byte0 = ((self.accuracy & 0x01) << 7) | ((self.second_tens & 0x07) << 4) | (self.second_unit & 0x0F)
         byte1 = ((self.sync_to_frame & 0x01) << 7) | ((self.minute_tens & 0x07) << 4) | (self.minute_unit & 0x0F)
-        return struct.pack('<BB', byte0, byte1)
+        return _BB.pack(byte0, byte1)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiMNSCTime2:
     """
     MNSC Time field 2 (2 bytes) - Hours and Days in BCD.
@@ -313,19 +359,19 @@ class EtiMNSCTime2:
 
     def set_from_time(self, dt: datetime) -> None:
         """Set from datetime object (BCD encoding)."""
-        self.hour_unit = dt.hour % 10
-        self.hour_tens = dt.hour // 10
-        self.day_unit = dt.day % 10
-        self.day_tens = dt.day // 10
+        self.hour_unit = _BCD_UNITS[dt.hour]
+        self.hour_tens = _BCD_TENS[dt.hour]
+        self.day_unit = _BCD_UNITS[dt.day]
+        self.day_tens = _BCD_TENS[dt.day]
 
     def pack(self) -> bytes:
         """Pack to 2 bytes."""
         byte0 = ((self.hour_tens & 0x0F) << 4) | (self.hour_unit & 0x0F)
         byte1 = ((self.day_tens & 0x0F) << 4) | (self.day_unit & 0x0F)
-        return struct.pack('<BB', byte0, byte1)
+        return _BB.pack(byte0, byte1)
 
 
-@dataclass
+@dataclass(slots=True)
 class EtiMNSCTime3:
     """
     MNSC Time field 3 (2 bytes) - Month and Year in BCD.
@@ -343,20 +389,84 @@ class EtiMNSCTime3:
 
     def set_from_time(self, dt: datetime) -> None:
         """Set from datetime object (BCD encoding, year from 2000)."""
-        self.month_unit = dt.month % 10
-        self.month_tens = dt.month // 10
-        year_since_2000 = dt.year - 2000
-        self.year_unit = year_since_2000 % 10
-        self.year_tens = year_since_2000 // 10
+        self.month_unit = _BCD_UNITS[dt.month]
+        self.month_tens = _BCD_TENS[dt.month]
+        year_since_2000 = (dt.year - 2000) % 100
+        self.year_unit = _BCD_UNITS[year_since_2000]
+        self.year_tens = _BCD_TENS[year_since_2000]
 
     def pack(self) -> bytes:
         """Pack to 2 bytes."""
         byte0 = ((self.month_tens & 0x0F) << 4) | (self.month_unit & 0x0F)
         byte1 = ((self.year_tens & 0x0F) << 4) | (self.year_unit & 0x0F)
-        return struct.pack('<BB', byte0, byte1)
+        return _BB.pack(byte0, byte1)
+
+
+def encode_stc_block(buf: bytearray, offset: int, scids: List[int],
+                     sads: List[int], tpls: List[int],
+                     stls: List[int]) -> int:
+    """
+    Encode a whole block of STC headers in one sweep.
+
+    Takes the subchannel fields as parallel sequences and writes every
+    4-byte header straight into the buffer, so a frame with many
+    subchannels pays one function call and one tight loop instead of
+    per-EtiSTC object dispatch.
+
+    Args:
+        buf: Destination buffer
+        offset: Write position of the first header
+        scids: Subchannel IDs (0-63), one per subchannel
+        sads: Start addresses (0-1023)
+        tpls: Protection levels (0-63)
+        stls: Stream lengths in 64-bit words (0-1023)
+
+    Returns:
+        The offset just past the last header
+    """
+    pack_into = _U32_LE.pack_into
+    for scid, sad, tpl, stl in zip(scids, sads, tpls, stls):
+        word = ((scid & 0x3F) << 2) | ((sad >> 8) & 0x03) | \
+               ((sad & 0xFF) << 8) | \
+               ((tpl & 0x3F) << 18) | (((stl >> 8) & 0x03) << 16) | \
+               ((stl & 0xFF) << 24)
+        pack_into(buf, offset, word)
+        offset += 4
+    return offset
+
+
+def pack_mnsc_time(dt: datetime, accuracy: int = 0, sync_to_frame: int = 0,
+                   identifier: int = 0, rfa: int = 0) -> bytes:
+    """
+    Pack the full 8-byte MNSC time block in a single operation.
+
+    Byte-identical to concatenating EtiMNSCTime0..3 for the same
+    datetime, but builds one 64-bit word instead of four objects and
+    four pack calls — use this on the per-second signalling path.
 
+    Args:
+        dt: Time to encode (BCD, year from 2000)
+        accuracy: Time accuracy flag (1 bit)
+        sync_to_frame: Sync to frame flag (1 bit)
+        identifier: Sub-type identifier (4 bits)
+        rfa: Reserved for future applications (8 bits)
 
-@dataclass
+    Returns:
+        8 bytes of MNSC time (fields 0-3)
+    """
+    year_since_2000 = (dt.year - 2000) % 100
+    word = (((identifier & 0x0F) << 4) << 56) | \
+           ((rfa & 0xFF) << 48) | \
+           ((((accuracy & 0x01) << 7) | (_BCD_TENS[dt.second] << 4) | _BCD_UNITS[dt.second]) << 40) | \
+           ((((sync_to_frame & 0x01) << 7) | (_BCD_TENS[dt.minute] << 4) | _BCD_UNITS[dt.minute]) << 32) | \
+           (((_BCD_TENS[dt.hour] << 4) | _BCD_UNITS[dt.hour]) << 24) | \
+           (((_BCD_TENS[dt.day] << 4) | _BCD_UNITS[dt.day]) << 16) | \
+           (((_BCD_TENS[dt.month] << 4) | _BCD_UNITS[dt.month]) << 8) | \
+           ((_BCD_TENS[year_since_2000] << 4) | _BCD_UNITS[year_since_2000])
+    return _U64_BE.pack(word)
+
+
+@dataclass(slots=True)
 class EtiFrame:
     """
     Complete ETI frame.
@@ -380,38 +490,143 @@ class EtiFrame:
     eof: EtiEOF
     tist: EtiTIST | None = None
 
+    def size(self) -> int:
+        """Total packed size of the frame in bytes."""
+        # SYNC + FC + EOH + EOF are 4 bytes each
+        size = 16 + 4 * len(self.stc_headers) + len(self.subchannel_data)
+        if self.fc.ficf:
+            size += len(self.fic_data)
+        if self.tist:
+            size += 4
+        return size
+
     def pack(self) -> bytes:
         """Pack complete ETI frame to bytes."""
-        data = bytearray()
-
-        # SYNC
-        data.extend(self.sync.pack())
+        buf = bytearray(self.size())
+        self.pack_into(buf, 0)
+        return bytes(buf)
 
-        # FC
-        data.extend(self.fc.pack())
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """
+        Pack the complete frame into a caller-provided buffer.
 
-        # STC headers
+        Writes every section at its running offset so a preallocated
+        transmit buffer can be filled without intermediate bytes
+        objects; returns the offset just past the frame.
+        """
+        offset = self.sync.pack_into(buf, offset)
+        offset = self.fc.pack_into(buf, offset)
         for stc in self.stc_headers:
-            data.extend(stc.pack())
-
-        # EOH
-        data.extend(self.eoh.pack())
+            offset = stc.pack_into(buf, offset)
+        offset = self.eoh.pack_into(buf, offset)
 
         # FIC data (if FICF=1)
         if self.fc.ficf:
-            data.extend(self.fic_data)
-
-        # Subchannel data
-        data.extend(self.subchannel_data)
+            end = offset + len(self.fic_data)
+            buf[offset:end] = self.fic_data
+            offset = end
 
-        # EOF
-        data.extend(self.eof.pack())
+        end = offset + len(self.subchannel_data)
+        buf[offset:end] = self.subchannel_data
+        offset = self.eof.pack_into(buf, end)
 
         # TIST (optional)
         if self.tist:
-            data.extend(self.tist.pack())
+            offset = self.tist.pack_into(buf, offset)
+
+        return offset
+
+    @classmethod
+    def compile_packer(cls, stc_headers: List[EtiSTC], mode: int = 1,
+                       fic_size: int = 96, with_tist: bool = False):
+        """
+        Generate a packer specialized for a fixed subchannel layout.
+
+        The subchannel configuration is known at mux startup and stable
+        for the run, so everything derivable from it — NST, FL, the STC
+        header bytes, and every section offset — is folded into the
+        generated source as literals; the returned function is
+        straight-line code that only fills in the per-frame fields.
+
+        The generated packer has the signature
+
+            pack_frame(fct, fp, fic_data, subchannel_data,
+                       mnsc=0, tist=0) -> bytes
+
+        and computes the EOH and EOF CRCs (XORed with 0xFFFF per
+        ETSI EN 300 799) in place. FSYNC alternation is derived from the
+        frame count parity.
 
-        return bytes(data)
+        Args:
+            stc_headers: STC header per subchannel, with final STL values
+            mode: Transmission mode (1-4)
+            fic_size: FIC section size in bytes (96 for Mode I)
+            with_tist: Append the 4-byte TIST field
+
+        Returns:
+            The compiled pack_frame callable
+        """
+        nst = len(stc_headers)
+        # Each STL is in 64-bit words, so the MST contribution is fixed
+        mst_size = sum(stc.stl * 8 for stc in stc_headers)
+
+        # FL = STC + FIC + MST + EOF in 32-bit words (excludes FC/EOH)
+        fl = nst + fic_size // 4 + (mst_size + 3) // 4 + 1
+
+        # Section offsets within the frame
+        eoh_off = 8 + 4 * nst
+        fic_off = eoh_off + 4
+        mst_off = fic_off + fic_size
+        eof_off = mst_off + mst_size
+        total = eof_off + (8 if with_tist else 4)
+
+        fc_const = (0x01 << 15) | ((nst & 0x7F) << 8) | \
+                   ((mode & 0x03) << 19) | \
+                   (((fl >> 8) & 0x07) << 16) | ((fl & 0xFF) << 24)
+        stc_bytes = b''.join(stc.pack() for stc in stc_headers)
+
+        lines = [
+            "def pack_frame(fct, fp, fic_data, subchannel_data, mnsc=0, tist=0):",
+            f"    if len(fic_data) != {fic_size}:",
+            "        raise ValueError("
+            f"f'FIC data must be {fic_size} bytes, got {{len(fic_data)}}')",
+            f"    if len(subchannel_data) != {mst_size}:",
+            "        raise ValueError("
+            f"f'MST data must be {mst_size} bytes, got {{len(subchannel_data)}}')",
+            f"    buf = bytearray({total})",
+            "    # SYNC: ERR=0xFF, FSYNC alternating on frame count parity",
+            "    _U32_BE.pack_into(buf, 0,"
+            " 0xFF073AB6 if fct & 1 == 0 else 0xFFF8C549)",
+            "    # FC with NST/FICF/MID/FL folded to a constant",
+            f"    _U32_LE.pack_into(buf, 4,"
+            f" (fct & 0xFF) | ((fp & 0x07) << 21) | {fc_const:#x})",
+        ]
+        if nst:
+            lines.append(f"    buf[8:{eoh_off}] = {stc_bytes!r}")
+        lines += [
+            "    # EOH: CRC over FC + STC + MNSC",
+            f"    eoh_crc = crc16(bytes(buf[4:{eoh_off}])"
+            " + (mnsc & 0xFFFF).to_bytes(2, 'big')) ^ 0xFFFF",
+            f"    _HH_BE.pack_into(buf, {eoh_off}, mnsc & 0xFFFF, eoh_crc)",
+            f"    buf[{fic_off}:{mst_off}] = fic_data",
+            f"    buf[{mst_off}:{eof_off}] = subchannel_data",
+            "    # EOF: CRC over FIC + MST",
+            f"    eof_crc = crc16(memoryview(buf)[{fic_off}:{eof_off}])"
+            " ^ 0xFFFF",
+            f"    _HH_BE.pack_into(buf, {eof_off}, eof_crc, 0)",
+        ]
+        if with_tist:
+            lines.append(f"    _U32_LE.pack_into(buf, {eof_off + 4}, tist)")
+        lines.append("    return bytes(buf)")
+
+        namespace = {
+            'crc16': crc16,
+            '_U32_BE': _U32_BE,
+            '_U32_LE': _U32_LE,
+            '_HH_BE': _HH_BE,
+        }
+        exec('\n'.join(lines), namespace)
+        return namespace['pack_frame']
 
     @classmethod
     def create_empty(cls, mode: int = 1, with_tist: bool = False) -> 'EtiFrame':
@@ -428,7 +643,7 @@ class EtiFrame:
         sync = EtiSync()
         fc = EtiFC(fct=0, nst=0, ficf=1, mid=mode, fp=0, fl=0)
         eoh = EtiEOH(mnsc=0, crc=0)
-        fic_data = bytes(96)  # Empty FIC (96 bytes when FICF=1)
+        fic_data = _EMPTY_FIC  # Empty FIC (96 bytes when FICF=1)
         eof = EtiEOF(crc=0, rfu=0x0000)
         tist = EtiTIST(tist=0) if with_tist else None
 
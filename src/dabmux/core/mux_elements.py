@@ -7,7 +7,7 @@ including services, components, subchannels, and the ensemble itself.
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, IntEnum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 # Protection levels and bitrates for UEP (Unequal Error Protection)
@@ -136,15 +136,27 @@ class DabLabel:
     short_text: str = ""
     flag: int = 0xFFFF  # Flag indicating which characters form short label
 
+    # Memoized encoding; labels change rarely compared to FIG rate
+    _ebu_latin_cache: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False)
+    _ebu_latin_text: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False)
+
     def to_ebu_latin(self) -> bytes:
         """
         Convert label to EBU Latin charset (16 bytes).
 
         For Phase 0, this is a stub that just encodes as UTF-8 and pads.
         Proper EBU Latin conversion will be implemented in Phase 2.
+
+        The encoded bytes are cached and only recomputed when the label
+        text changes; the FIG encoders call this on every fill.
         """
-        encoded = self.text.encode('utf-8', errors='replace')[:16]
-        return encoded.ljust(16, b' ')
+        if self._ebu_latin_text != self.text:
+            encoded = self.text.encode('utf-8', errors='replace')[:16]
+            self._ebu_latin_cache = encoded.ljust(16, b' ')
+            self._ebu_latin_text = self.text
+        return self._ebu_latin_cache
 
     def validate(self) -> bool:
         """Validate label length constraints."""
@@ -372,6 +384,12 @@ class DabSubchannel:
     pad: Optional[PADConfig] = None  # PAD configuration for this subchannel
     fec_scheme: int = 0  # FEC scheme code (0=none, 1=RS(204,188), 2-3=reserved)
 
+    # Memoized size; recomputed when bitrate or protection settings change
+    _size_cu_cache: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False)
+    _size_cu_key: tuple = field(
+        default=(), init=False, repr=False, compare=False)
+
     def get_size_cu(self) -> int:
         """
         Calculate subchannel size in Capacity Units (CU).
@@ -381,7 +399,21 @@ class DabSubchannel:
         the MST capacity allocation, not the RS-encoded data size.
 
         Formula from ETSI EN 300 401 and ODR-DabMux implementation.
+
+        The result is memoized on the inputs (bitrate and protection
+        settings), which rarely change after configuration.
         """
+        key = (self.bitrate, self.protection.form, self.protection.level,
+               self.protection.eep.profile if self.protection.eep else None)
+        if self._size_cu_cache is not None and self._size_cu_key == key:
+            return self._size_cu_cache
+        size_cu = self._compute_size_cu()
+        self._size_cu_cache = size_cu
+        self._size_cu_key = key
+        return size_cu
+
+    def _compute_size_cu(self) -> int:
+        """Derive the CU size from bitrate and protection settings."""
         if self.protection.form == ProtectionForm.UEP:
             # UEP: Use table lookup
             key = (self.bitrate, self.protection.level)
@@ -687,6 +719,23 @@ class RemoteControlConfig:
     audit_log_file: Optional[str] = None
 
 
+@dataclass
+class EnsembleIndex:
+    """
+    Precomputed lookup structures over an ensemble's collections.
+
+    The FIG encoders repeatedly partition services and match components
+    to services/subchannels on every fill; this index is built in one
+    pass and reused until the ensemble changes.
+    """
+    programme_services: List[DabService] = field(default_factory=list)
+    data_services: List[DabService] = field(default_factory=list)
+    components_by_service: Dict[int, List[DabComponent]] = field(default_factory=dict)
+    subchannel_by_id: Dict[int, DabSubchannel] = field(default_factory=dict)
+    # SId pre-serialized big-endian: 2 bytes for programme, 4 for data
+    sid_bytes: Dict[int, bytes] = field(default_factory=dict)
+
+
 @dataclass
 class DabEnsemble:
     """
@@ -735,6 +784,43 @@ class DabEnsemble:
     components: List[DabComponent] = field(default_factory=list)
     subchannels: List[DabSubchannel] = field(default_factory=list)
 
+    # Cached index over the collections; None when stale
+    _index: Optional[EnsembleIndex] = field(
+        default=None, init=False, repr=False, compare=False)
+    _index_sizes: tuple = field(
+        default=(), init=False, repr=False, compare=False)
+
+    def get_index(self) -> EnsembleIndex:
+        """
+        Get the cached lookup index, rebuilding it if stale.
+
+        The index is invalidated automatically when the number of
+        services, components, or subchannels changes; call
+        invalidate_index() after mutating elements in place.
+        """
+        sizes = (len(self.services), len(self.components), len(self.subchannels))
+        if self._index is None or self._index_sizes != sizes:
+            index = EnsembleIndex()
+            for service in self.services:
+                if service.id < 0x10000:
+                    index.programme_services.append(service)
+                    index.sid_bytes[service.id] = service.id.to_bytes(2, 'big')
+                else:
+                    index.data_services.append(service)
+                    index.sid_bytes[service.id] = service.id.to_bytes(4, 'big')
+            for component in self.components:
+                index.components_by_service.setdefault(
+                    component.service_id, []).append(component)
+            for subchannel in self.subchannels:
+                index.subchannel_by_id[subchannel.id] = subchannel
+            self._index = index
+            self._index_sizes = sizes
+        return self._index
+
+    def invalidate_index(self) -> None:
+        """Force the lookup index to be rebuilt on next access."""
+        self._index = None
+
     def get_service(self, uid: str) -> Optional[DabService]:
         """Get service by UID."""
         for service in self.services:
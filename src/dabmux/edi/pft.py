@@ -11,6 +11,10 @@ from typing import List, Optional
 from dabmux.utils.crc import crc16
 from dabmux.fec.reed_solomon import ReedSolomonEncoder
 
+# Precompiled PF header layouts for in-place assembly
+_U16_BE = struct.Struct('>H')
+_U16_BE_PAIR = struct.Struct('>HH')
+
 # PFT constants
 PF_SYNC = b"PF"
 PF_RS_K = 207  # RS data word length
@@ -104,6 +108,68 @@ class PFFragment:
 
         return bytes(packet)
 
+    def size(self) -> int:
+        """Total packed size of the fragment in bytes."""
+        return (14 + (2 if self.fec else 0) + (4 if self.addr else 0)
+                + len(self.payload))
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """
+        Pack the PF fragment into a caller-provided buffer.
+
+        Same layout as assemble(), written in place so a preallocated
+        transmit buffer can hold all fragments of a packet back to
+        back; returns the offset just past the fragment.
+        """
+        pos = offset
+
+        # Psync (2 bytes)
+        buf[pos:pos + 2] = PF_SYNC
+        pos += 2
+
+        # Pseq (2 bytes)
+        _U16_BE.pack_into(buf, pos, self.pseq & 0xFFFF)
+        pos += 2
+
+        # Findex and Fcount (3 bytes each, 24-bit big-endian)
+        findex = self.findex & 0xFFFFFF
+        fcount = self.fcount & 0xFFFFFF
+        buf[pos:pos + 6] = bytes((
+            findex >> 16, (findex >> 8) & 0xFF, findex & 0xFF,
+            fcount >> 16, (fcount >> 8) & 0xFF, fcount & 0xFF,
+        ))
+        pos += 6
+
+        # Plen (2 bytes)
+        plen = len(self.payload) & 0x3FFF  # 14 bits for length
+        if self.fec:
+            plen |= 0x8000
+        if self.addr:
+            plen |= 0x4000
+        _U16_BE.pack_into(buf, pos, plen)
+        pos += 2
+
+        # RSk and RSz (if FEC enabled)
+        if self.fec:
+            buf[pos] = self.rs_k & 0xFF
+            buf[pos + 1] = self.rs_z & 0xFF
+            pos += 2
+
+        # Source and Dest (if ADDR enabled)
+        if self.addr:
+            _U16_BE_PAIR.pack_into(buf, pos, self.source, self.dest)
+            pos += 4
+
+        # CRC over the header, computed in place over a view
+        crc_value = crc16(memoryview(buf)[offset:pos])
+        _U16_BE.pack_into(buf, pos, crc_value)
+        pos += 2
+
+        # Payload
+        end = pos + len(self.payload)
+        buf[pos:end] = self.payload
+        return end
+
     @classmethod
     def parse(cls, data: bytes) -> Optional['PFFragment']:
         """
@@ -305,18 +371,13 @@ class PFTFragmenter:
         # Calculate number of fragments
         num_fragments = math.ceil(len(rs_block) / s_max)
 
-        # Calculate actual fragment size
-        fragment_size = math.ceil(len(rs_block) / num_fragments)
-
-        # Create fragments with interleaving (column-major order)
+        # Create fragments with interleaving (column-major order).
+        # Fragment i takes bytes i, i+num_fragments, i+2*num_fragments, ...
+        # which is exactly a strided slice, so the whole column comes out
+        # in one C-level copy instead of a per-byte append loop.
         fragments = []
         for i in range(num_fragments):
-            # Extract fragment data (interleaved)
-            fragment_data = bytearray()
-            for j in range(fragment_size):
-                idx = j * num_fragments + i
-                if idx < len(rs_block):
-                    fragment_data.append(rs_block[idx])
+            fragment_data = bytes(rs_block[i::num_fragments])
 
             fragment = PFFragment(
                 pseq=self._pseq,
@@ -324,7 +385,7 @@ class PFTFragmenter:
                 fcount=num_fragments,
                 fec=True,
                 addr=self.config.addr,
-                payload=bytes(fragment_data),
+                payload=fragment_data,
                 source=self.config.source_addr,
                 dest=self.config.dest_addr,
                 rs_k=chunk_len,
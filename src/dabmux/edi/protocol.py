@@ -8,7 +8,7 @@ import struct
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import List, Optional
-from dabmux.utils.crc import crc16
+from dabmux.utils.crc import crc16, crc16_update
 
 # EDI constants
 EDI_EPOCH_UNIX = 946684800  # 2000-01-01 00:00:00 UTC
@@ -16,6 +16,15 @@ AF_SYNC = b"AF"
 AF_HEADER_VERSION = 0x10  # Major=1, Minor=0
 AF_PT_TAG = ord('T')
 
+# Compiled layouts, parsed once at import
+_AF_HEADER = struct.Struct('>2sIHBB')  # SYNC, LEN, SEQ, AR_CF, PT
+_U16_BE = struct.Struct('>H')
+_U32_BE = struct.Struct('>I')
+
+# Pre-encoded estN TAG names for the 64 possible subchannel indices,
+# so get_name is a tuple index instead of an f-string format + encode
+_EST_NAMES = tuple(f"est{i}".encode('ascii') for i in range(1, 65))
+
 
 class TagItem(ABC):
     """
@@ -25,7 +34,17 @@ class TagItem(ABC):
     - Name: 4 bytes (ASCII)
     - Length: 4 bytes (value length in BITS, big-endian)
     - Value: variable length data
+
+    Assembled bytes are cached per instance; any field assignment marks
+    the cache dirty, so tags whose fields are stable frame-to-frame
+    (e.g. the constant *ptr tag) are only serialized once.
     """
+    __slots__ = ('_cache', '_dirty')
+
+    def __setattr__(self, name, value):
+        object.__setattr__(self, name, value)
+        if name != '_cache' and name != '_dirty':
+            object.__setattr__(self, '_dirty', True)
 
     @abstractmethod
     def get_name(self) -> bytes:
@@ -44,17 +63,27 @@ class TagItem(ABC):
         Returns:
             Complete TAG item (name + length + value)
         """
-        name = self.get_name()
+        if not getattr(self, '_dirty', True):
+            return self._cache
+
         value = self.get_value()
 
-        # Length is in BITS
-        length_bits = len(value) * 8
+        # Pack: name(4) + length in BITS (4, big-endian) + value
+        data = self.get_name() + _U32_BE.pack(len(value) * 8) + value
+
+        object.__setattr__(self, '_cache', data)
+        object.__setattr__(self, '_dirty', False)
+        return data
 
-        # Pack: name(4) + length(4, big-endian) + value
-        return name + struct.pack('>I', length_bits) + value
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """Pack into a caller-provided buffer; return the next offset."""
+        data = self.assemble()
+        end = offset + len(data)
+        buf[offset:end] = data
+        return end
 
 
-@dataclass
+@dataclass(slots=True)
 class TagStarPTR(TagItem):
     """
     *ptr TAG: Protocol Type and Revision.
@@ -81,7 +110,7 @@ class TagStarPTR(TagItem):
         return protocol_bytes + struct.pack('>HH', self.major, self.minor)
 
 
-@dataclass
+@dataclass(slots=True)
 class TagDETI(TagItem):
     """
     deti TAG: DAB ETI Management.
@@ -149,7 +178,7 @@ class TagDETI(TagItem):
         if self.atstf:
             value.append(self.utco & 0xFF)
             value.extend(struct.pack('>I', self.seconds))
-            value.extend(struct.pack('>I', self.tsta)[1:])  # 3 bytes (24-bit)
+            value.extend((self.tsta & 0xFFFFFF).to_bytes(3, 'big'))
 
         # FIC (optional)
         if self.ficf and self.fic_data:
@@ -157,12 +186,12 @@ class TagDETI(TagItem):
 
         # RFUD (optional, 3 bytes)
         if self.rfudf:
-            value.extend(struct.pack('>I', self.rfud)[1:])  # 3 bytes (24-bit)
+            value.extend((self.rfud & 0xFFFFFF).to_bytes(3, 'big'))
 
         return bytes(value)
 
 
-@dataclass
+@dataclass(slots=True)
 class TagESTn(TagItem):
     """
     estN TAG: ETI Sub-Channel Stream.
@@ -178,6 +207,8 @@ class TagESTn(TagItem):
 
     def get_name(self) -> bytes:
         """Get TAG name (e.g., b"est1", b"est2", ...)."""
+        if 1 <= self.id <= 64:
+            return _EST_NAMES[self.id - 1]
         return f"est{self.id}".encode('ascii')
 
     def get_value(self) -> bytes:
@@ -195,13 +226,11 @@ class TagESTn(TagItem):
                ((self.tpl & 0x3F) << 2) | \
                (self.rfa & 0x03)
 
-        value = struct.pack('>I', sstc)[1:]  # 3 bytes (24-bit)
-        value += self.mst_data
-
-        return value
+        # Emit the 24-bit SSTC directly, avoiding a 4-byte pack + slice
+        return sstc.to_bytes(3, 'big') + self.mst_data
 
 
-@dataclass
+@dataclass(slots=True)
 class TagTIST(TagItem):
     """
     tist TAG: Timestamp for transmitter synchronization.
@@ -270,7 +299,7 @@ class TagTIST(TagItem):
         return TagTIST.from_unix_timestamp(time.time())
 
 
-@dataclass
+@dataclass(slots=True)
 class TagPacket:
     """
     TAG Packet: Collection of TAG items.
@@ -287,21 +316,20 @@ class TagPacket:
         Returns:
             Concatenated TAG items with alignment padding
         """
-        data = bytearray()
-
-        # Assemble all TAG items
-        for tag in self.tag_items:
-            data.extend(tag.assemble())
+        # Assemble all TAG items and join them in one C-level pass
+        parts = [tag.assemble() for tag in self.tag_items]
 
         # Apply alignment padding
         if self.alignment > 0:
-            padding_needed = (self.alignment - (len(data) % self.alignment)) % self.alignment
-            data.extend(b'\x00' * padding_needed)
+            total = sum(map(len, parts))
+            padding_needed = (-total) % self.alignment
+            if padding_needed:
+                parts.append(b'\x00' * padding_needed)
 
-        return bytes(data)
+        return b''.join(parts)
 
 
-@dataclass
+@dataclass(slots=True)
 class AFPacket:
     """
     AF Packet: Application Framing packet.
@@ -324,24 +352,50 @@ class AFPacket:
         - Payload: TAG packet data
         - CRC: 2 bytes (CRC-16 over header + payload)
         """
-        # Build header (10 bytes total)
-        header = bytearray()
-        header.extend(AF_SYNC)                                    # SYNC (2 bytes)
-        header.extend(struct.pack('>I', len(self.payload)))      # LEN (4 bytes)
-        header.extend(struct.pack('>H', self.seq & 0xFFFF))      # SEQ (2 bytes)
-        header.append(AF_HEADER_VERSION | 0x80)                  # AR_CF (1 byte, CRC=1)
-        header.append(AF_PT_TAG)                                 # PT (1 byte)
-
-        # Combine header + payload
-        packet_data = bytes(header) + self.payload
-
-        # Calculate CRC over header + payload
-        crc_value = crc16(packet_data)
-
-        # Append CRC (big-endian)
-        packet_data += struct.pack('>H', crc_value)
+        # Build header (10 bytes) in a single pack call
+        header = _AF_HEADER.pack(
+            AF_SYNC,
+            len(self.payload),
+            self.seq & 0xFFFF,
+            AF_HEADER_VERSION | 0x80,  # AR_CF (CRC=1)
+            AF_PT_TAG
+        )
+
+        # Calculate CRC over header + payload incrementally, so the
+        # payload is never copied just to feed the CRC
+        crc_value = crc16_update(crc16_update(0xFFFF, header), self.payload)
+
+        # Single join of header + payload + CRC (big-endian)
+        return b''.join((header, self.payload, _U16_BE.pack(crc_value)))
+
+    def size(self) -> int:
+        """Total packed size of the packet in bytes."""
+        return 12 + len(self.payload)
+
+    def pack_into(self, buf: bytearray, offset: int = 0) -> int:
+        """
+        Pack the AF packet into a caller-provided buffer.
 
-        return packet_data
+        Writes header, payload, and CRC in place so a preallocated
+        transmit buffer can be reused across frames; returns the offset
+        just past the packet.
+        """
+        payload_len = len(self.payload)
+        _AF_HEADER.pack_into(
+            buf, offset,
+            AF_SYNC,
+            payload_len,
+            self.seq & 0xFFFF,
+            AF_HEADER_VERSION | 0x80,  # AR_CF (CRC=1)
+            AF_PT_TAG
+        )
+        end = offset + 10 + payload_len
+        buf[offset + 10:end] = self.payload
+
+        # CRC over header + payload, computed in place over a view
+        crc_value = crc16(memoryview(buf)[offset:end])
+        _U16_BE.pack_into(buf, end, crc_value)
+        return end + 2
 
     @classmethod
     def parse(cls, data: bytes) -> Optional['AFPacket']:
@@ -357,16 +411,11 @@ class AFPacket:
         if len(data) < 12:  # Minimum: 10-byte header + 2-byte CRC
             return None
 
-        # Check SYNC
-        if data[:2] != AF_SYNC:
+        # Parse header in one unpack, then check SYNC
+        sync, payload_len, seq, ar_cf, pt = _AF_HEADER.unpack_from(data, 0)
+        if sync != AF_SYNC:
             return None
 
-        # Parse header
-        payload_len = struct.unpack('>I', data[2:6])[0]
-        seq = struct.unpack('>H', data[6:8])[0]
-        ar_cf = data[8]
-        pt = data[9]
-
         # Verify PT
         if pt != AF_PT_TAG:
             return None
@@ -375,14 +424,15 @@ class AFPacket:
         if len(data) < 10 + payload_len + 2:
             return None
 
-        # Extract payload and CRC
-        payload = data[10:10 + payload_len]
-        crc_received = struct.unpack('>H', data[10 + payload_len:10 + payload_len + 2])[0]
+        crc_received = _U16_BE.unpack_from(data, 10 + payload_len)[0]
 
-        # Verify CRC (if CRC flag is set)
+        # Verify CRC (if CRC flag is set) over a zero-copy view so the
+        # header+payload bytes are not duplicated just to feed the CRC
+        mv = memoryview(data)
         if ar_cf & 0x80:
-            crc_calculated = crc16(data[:10 + payload_len])
+            crc_calculated = crc16(mv[:10 + payload_len])
             if crc_calculated != crc_received:
                 return None
 
-        return cls(seq=seq, payload=payload)
+        # Materialize the payload once, at the end
+        return cls(seq=seq, payload=bytes(mv[10:10 + payload_len]))
@@ -24,6 +24,12 @@ class FIGCarousel:
         self.figs: List[FIGBase] = []
         self._start_time_ms: int = 0
         self._initial_phase_duration_ms: int = 5000  # 5 seconds
+        # Reusable scratch buffer for individual FIG fills; fill_fib is
+        # synchronous, so one buffer serves every FIG without reallocation.
+        # The zeros template re-blanks it between fills so a FIG can
+        # never lift stale bytes from an earlier fill into the FIB.
+        self._fig_buf = bytearray(32)
+        self._fig_buf_zeros = bytes(32)
 
     def add_fig(self, fig: FIGBase) -> None:
         """
@@ -81,8 +87,15 @@ class FIGCarousel:
                 # No space for even a minimal FIG
                 break
 
-            # Create a temporary buffer for this FIG
-            temp_buf = bytearray(remaining)
+            # Fill into the reusable scratch buffer, blanked first so a
+            # FIG whose written and reported byte counts ever disagree
+            # emits deterministic zeros instead of leftovers from a
+            # previous fill
+            if remaining > len(self._fig_buf):
+                self._fig_buf = bytearray(remaining)
+                self._fig_buf_zeros = bytes(remaining)
+            temp_buf = self._fig_buf
+            temp_buf[:] = self._fig_buf_zeros
             status = fig.fill(temp_buf, remaining)
 
             if status.num_bytes_written > 0:
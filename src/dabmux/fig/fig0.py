@@ -6,11 +6,28 @@ This module implements the most important FIG 0 variants.
 """
 import struct
 import structlog
+from bisect import bisect_right
 import time
 from datetime import datetime
 from typing import List
 from dabmux.fig.base import FIGBase, FIGRate, FillStatus, FIGPriority
 
+# Bound pack_into methods of precompiled Structs; skips the per-call
+# format-string cache lookup on every FIG emission
+_pack_h_into = struct.Struct('>H').pack_into
+_pack_i_into = struct.Struct('>I').pack_into
+# Whole FIG 0/0: 4-byte static prefix + CIF counter word, one call
+_pack_fig00_into = struct.Struct('>4sH').pack_into
+# Two-byte entry used by the append-style fills (FIG 0/5, FIG 0/8)
+_pack_bb = struct.Struct('>BB').pack
+
+# CIF counter words for FIG 0/0, precomputed for the full 0-4999 cycle:
+# high 5 bits ((cif // 250) % 20) shifted into byte 4, low byte (cif % 250)
+# in byte 5. Bits 10 (alarm) and 9-8 (change) are OR'd in per frame.
+_CIF_WORDS = tuple(
+    (((cif // 250) % 20) << 11) | (cif % 250) for cif in range(5000)
+)
+
 logger = structlog.get_logger()
 from dabmux.core.mux_elements import (
     DabEnsemble,
@@ -111,6 +128,34 @@ class FIG0_0(FIGBase):
         super().__init__()
         self.ensemble = ensemble
         self.current_frame = current_frame
+        self._template = b''
+        self._template_key = None
+
+    def _get_template(self) -> bytes:
+        """
+        Return the static first 4 bytes (FIG header + EId).
+
+        Only the CIF counter bytes change between frames, so the prefix is
+        serialized once and patched with the counter in fill().
+        """
+        key = self.ensemble.id
+        if key != self._template_key:
+            # Byte 0: FIG type (3 bits) | Length (5 bits)
+            # Byte 1: CN | OE | PD | Extension
+            fig_type = 0  # Type 0
+            length = 4    # 4 bytes of data after header
+            cn = 0        # Current/Next: 0 = current
+            oe = 0        # Other Ensemble: 0 = this ensemble
+            pd = 0        # Programme/Data: 0 = programme services
+
+            self._template = bytes((
+                (fig_type << 5) | (length & 0x1F),
+                (cn << 7) | (oe << 6) | (pd << 5) | 0,  # Extension = 0
+                (self.ensemble.id >> 8) & 0xFF,
+                self.ensemble.id & 0xFF,
+            ))
+            self._template_key = key
+        return self._template
 
     def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
@@ -128,31 +173,17 @@ class FIG0_0(FIGBase):
         if max_size < 6:
             return status
 
-        # FIG header (2 bytes)
-        # Byte 0: FIG type (3 bits) | Length (5 bits)
-        # Byte 1: CN | OE | PD | Extension
-        fig_type = 0  # Type 0
-        length = 4    # 4 bytes of data after header
-        cn = 0        # Current/Next: 0 = current
-        oe = 0        # Other Ensemble: 0 = this ensemble
-        pd = 0        # Programme/Data: 0 = programme services
-
-        buf[0] = (fig_type << 5) | (length & 0x1F)
-        buf[1] = (cn << 7) | (oe << 6) | (pd << 5) | 0  # Extension = 0
-
-        # FIG 0/0 data (4 bytes)
-        # EId (2 bytes, big-endian)
-        struct.pack_into('>H', buf, 2, self.ensemble.id)
-
-        # Change flags and CIF counter (2 bytes)
+        # Change flags and CIF counter (2 bytes); the counter bytes come
+        # from the precomputed table, only alarm/change are OR'd in
         change = 0       # Change flags: 00 = no change
         al = 1 if self.ensemble.alarm_flag else 0  # Alarm flag
-        cif_count = self.current_frame % 5000  # CIF counter (0-4999)
-        cif_count_high = (cif_count // 250) % 20  # High 5 bits
-        cif_count_low = cif_count % 250            # Low 8 bits
 
-        buf[4] = (cif_count_high << 3) | (al << 2) | (change & 0x03)
-        buf[5] = cif_count_low & 0xFF
+        # Static prefix (header + EId) plus the counter word in one call
+        _pack_fig00_into(
+            buf, 0, self._get_template(),
+            _CIF_WORDS[self.current_frame % 5000]
+            | (al << 10) | ((change & 0x03) << 8),
+        )
 
         status.num_bytes_written = 6
         status.complete_fig_transmitted = True
@@ -198,6 +229,67 @@ class FIG0_1(FIGBase):
         super().__init__()
         self.ensemble = ensemble
         self.subchannel_index = 0
+        self._entries: List[bytes] = []
+        self._entry_blob = b''
+        self._entry_cum: List[int] = [0]
+        self._entries_index = None
+
+    def _encode_subchannel(self, subchannel) -> bytes:
+        """
+        Encode a single subchannel entry (3 bytes UEP, 4 bytes EEP).
+
+        Entries are immutable for a given ensemble configuration, so they
+        are built once per index rebuild rather than on every fill. This
+        also keeps the data-dependent UEP/EEP branch out of the fill loop:
+        it runs here, once per subchannel per rebuild.
+        """
+        # DAB+ always uses EEP because it has Reed-Solomon FEC
+        is_uep = (subchannel.protection.form == ProtectionForm.UEP)
+        start_addr = subchannel.start_address
+
+        if is_uep:
+            # Short form (UEP): 3 bytes
+            # Byte 0: SubChId (6 bits) | Start Address high (2 bits)
+            # Byte 1: Start Address low (8 bits)
+            # Byte 2: Form (1 bit) | Table Switch (1 bit) | Table Index (6 bits)
+            # According to ETSI EN 300 799, bit layout is: Bit 7=Form, Bit 6=Switch, Bits 5-0=Table Index
+            table_index = subchannel.protection.to_tpl(subchannel.bitrate) & 0x3F
+            table_switch = 0  # Always 0 for now
+            form = 0  # 0 = short form (UEP)
+
+            return bytes((
+                (subchannel.id << 2) | ((start_addr >> 8) & 0x03),
+                start_addr & 0xFF,
+                (form << 7) | (table_switch << 6) | table_index,
+            ))
+
+        # Long form (EEP): 4 bytes
+        # Byte 0: SubChId (6 bits) | Start Address high (2 bits)
+        # Byte 1: Start Address low (8 bits)
+        # Byte 2: Sub-channel size high (2) | Protection level (2) | Option (3) | Form (1)
+        # Byte 3: Sub-channel size low (8 bits)
+        size_cu = subchannel.get_size_cu()
+        protection_level = subchannel.protection.level
+        option = subchannel.protection.eep.get_option() if subchannel.protection.eep else 0
+        form = 1  # 1 = long form (EEP)
+
+        logger.debug(
+            "Encoding EEP subchannel",
+            subchan_id=subchannel.id,
+            subchan_type=subchannel.type,
+            start_addr=start_addr,
+            size_cu=size_cu,
+            protection_level=protection_level,
+            option=option,
+            form=form
+        )
+
+        return bytes((
+            (subchannel.id << 2) | ((start_addr >> 8) & 0x03),
+            start_addr & 0xFF,
+            (form << 7) | ((option & 0x07) << 4) | ((protection_level & 0x03) << 2) | ((size_cu >> 8) & 0x03),
+            size_cu & 0xFF,
+        ))
 
     def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
@@ -219,84 +311,46 @@ class FIG0_1(FIGBase):
         start_pos = 0
 
         # Reserve space for header (will be filled later)
-        pos = 2
-        bytes_written_data = 0
+        pos: int = 2
+        bytes_written_data: int = 0
 
         # Iterate through subchannels
         subchannels = self.ensemble.subchannels
         if not subchannels:
             return status
 
-        while self.subchannel_index < len(subchannels):
-            subchannel = subchannels[self.subchannel_index]
-
-            # Determine if UEP or EEP
-            # UEP uses short form (3 bytes), EEP uses long form (4 bytes)
-            # DAB+ always uses EEP because it has Reed-Solomon FEC
-            is_uep = (subchannel.protection.form == ProtectionForm.UEP)
-
-            # UEP = 3 bytes, EEP = 4 bytes
-            entry_size = 3 if is_uep else 4
-
-            if pos + entry_size > max_size:
-                # No more space
-                break
-
-            # Write subchannel entry
-            if is_uep:
-                # Short form (UEP): 3 bytes
-                # Byte 0: SubChId (6 bits) | Start Address high (2 bits)
-                # Byte 1: Start Address low (8 bits)
-                # Byte 2: Form (1 bit) | Table Switch (1 bit) | Table Index (6 bits)
-                # According to ETSI EN 300 799, bit layout is: Bit 7=Form, Bit 6=Switch, Bits 5-0=Table Index
-                start_addr = subchannel.start_address
-                table_index = subchannel.protection.to_tpl(subchannel.bitrate) & 0x3F
-                table_switch = 0  # Always 0 for now
-                form = 0  # 0 = short form (UEP)
-
-                buf[pos] = (subchannel.id << 2) | ((start_addr >> 8) & 0x03)
-                buf[pos + 1] = start_addr & 0xFF
-                buf[pos + 2] = (form << 7) | (table_switch << 6) | table_index
-
-                pos += 3
-                bytes_written_data += 3
-            else:
-                # Long form (EEP): 4 bytes
-                # Byte 0: SubChId (6 bits) | Start Address high (2 bits)
-                # Byte 1: Start Address low (8 bits)
-                # Byte 2: Sub-channel size high (2) | Protection level (2) | Option (3) | Form (1)
-                # Byte 3: Sub-channel size low (8 bits)
-                start_addr = subchannel.start_address
-                size_cu = subchannel.get_size_cu()
-                protection_level = subchannel.protection.level
-                option = subchannel.protection.eep.get_option() if subchannel.protection.eep else 0
-                form = 1  # 1 = long form (EEP)
-
-                logger.debug(
-                    "Encoding EEP subchannel",
-                    subchan_id=subchannel.id,
-                    subchan_type=subchannel.type,
-                    start_addr=start_addr,
-                    size_cu=size_cu,
-                    protection_level=protection_level,
-                    option=option,
-                    form=form
-                )
-
-                buf[pos] = (subchannel.id << 2) | ((start_addr >> 8) & 0x03)
-                buf[pos + 1] = start_addr & 0xFF
-                buf[pos + 2] = (form << 7) | ((option & 0x07) << 4) | ((protection_level & 0x03) << 2) | ((size_cu >> 8) & 0x03)
-                buf[pos + 3] = size_cu & 0xFF
-
-                pos += 4
-                bytes_written_data += 4
-
-            self.subchannel_index += 1
-
-        # Check if we wrote anything
-        if bytes_written_data == 0:
+        # Rebuild the pre-encoded entries whenever the ensemble index does
+        index = self.ensemble.get_index()
+        if index is not self._entries_index:
+            self._entries = [self._encode_subchannel(sc) for sc in subchannels]
+            self._entry_blob = b''.join(self._entries)
+            cum = [0]
+            for entry in self._entries:
+                cum.append(cum[-1] + len(entry))
+            self._entry_cum = cum
+            self._entries_index = index
+            # The resume point belongs to the old subchannel list; if
+            # it now lies past the rebuilt entries, restart the cycle
+            # rather than index stale prefix sums
+            if self.subchannel_index >= len(self._entries):
+                self.subchannel_index = 0
+
+        # Determine how many whole entries fit in the remaining space by
+        # bisecting the prefix sums, then copy them in one slice assignment
+        # instead of checking the bound on every iteration
+        cum = self._entry_cum
+        start = self.subchannel_index
+        base = cum[start]
+        end = bisect_right(cum, base + (max_size - 2)) - 1
+
+        if end <= start:
             return status
 
+        data = self._entry_blob[base:cum[end]]
+        buf[pos:pos + len(data)] = data
+        bytes_written_data = len(data)
+        self.subchannel_index = end
+
         # Fill header
         fig_type = 0
         length = bytes_written_data + 1  # +1 for second header byte
@@ -383,18 +437,27 @@ class FIG0_2(FIGBase):
             return status
 
         # Reserve space for header
-        pos = 2
-        bytes_written_data = 0
+        pos: int = 2
+        bytes_written_data: int = 0
 
-        while self.service_index < len(services):
-            service = services[self.service_index]
+        # Hoist lookups out of the loop; the body is pure bit arithmetic
+        # and byte stores, so attribute chases dominate its cost
+        index = self.ensemble.get_index()
+        components_for = index.components_by_service.get
+        subchannel_for = index.subchannel_by_id.get
+        sid_bytes = index.sid_bytes
+        num_services = len(services)
+        service_index = self.service_index
+
+        while service_index < num_services:
+            service = services[service_index]
 
             # Count components for this service
-            components = [c for c in self.ensemble.components if c.service_id == service.id]
+            components = components_for(service.id, [])
             num_components = len(components)
 
             if num_components == 0:
-                self.service_index += 1
+                service_index += 1
                 continue
 
             # Calculate size needed
@@ -412,7 +475,7 @@ class FIG0_2(FIGBase):
                 # Programme service (16-bit SId): 3 bytes
                 # Bytes 0-1: SId (16-bit, big-endian)
                 # Byte 2: Local flag (1) | CAId (3) | NbServiceComp (4)
-                struct.pack_into('>H', buf, pos, service.id & 0xFFFF)
+                buf[pos:pos + 2] = sid_bytes[service.id]
                 buf[pos + 2] = (0 << 7) | (0 << 4) | (num_components & 0x0F)  # Local=0, CAId=0
                 pos += 3
                 bytes_written_data += 3
@@ -420,7 +483,7 @@ class FIG0_2(FIGBase):
                 # Data service (32-bit SId): 5 bytes
                 # Bytes 0-3: SId (32-bit, big-endian)
                 # Byte 4: Local flag (1) | CAId (3) | NbServiceComp (4)
-                struct.pack_into('>I', buf, pos, service.id)
+                buf[pos:pos + 4] = sid_bytes[service.id]
                 buf[pos + 4] = (0 << 7) | (0 << 4) | (num_components & 0x0F)
                 pos += 5
                 bytes_written_data += 5
@@ -439,11 +502,7 @@ class FIG0_2(FIGBase):
                 ascty = 0  # Default to DAB
 
                 # Look up subchannel to determine audio type
-                subchannel = None
-                for sc in self.ensemble.subchannels:
-                    if sc.id == component.subchannel_id:
-                        subchannel = sc
-                        break
+                subchannel = subchannel_for(component.subchannel_id)
 
                 if subchannel:
                     if subchannel.type == SubchannelType.DABPlusAudio:
@@ -455,12 +514,18 @@ class FIG0_2(FIGBase):
                 ps = 1    # Primary/Secondary: 1 = primary
                 ca = 0    # CA flag: 0 = not conditional access
 
-                buf[pos] = (tmid << 6) | (ascty & 0x3F)
-                buf[pos + 1] = ((component.subchannel_id & 0x3F) << 2) | (ps << 1) | ca
+                # Both bytes fused into one 16-bit big-endian store
+                _pack_h_into(
+                    buf, pos,
+                    ((tmid << 6) | (ascty & 0x3F)) << 8
+                    | ((component.subchannel_id & 0x3F) << 2) | (ps << 1) | ca,
+                )
                 pos += 2
                 bytes_written_data += 2
 
-            self.service_index += 1
+            service_index += 1
+
+        self.service_index = service_index
 
         if bytes_written_data == 0:
             return status
@@ -497,17 +562,19 @@ class FIG0_2(FIGBase):
 
     def _get_current_service_list(self) -> List[DabService]:
         """Get current service list (audio or data)."""
+        index = self.ensemble.get_index()
         if self.transmitting_audio:
-            return [s for s in self.ensemble.services if s.id < 0x10000]  # Programme services
+            return index.programme_services
         else:
-            return [s for s in self.ensemble.services if s.id >= 0x10000]  # Data services
+            return index.data_services
 
     def _get_other_service_list(self) -> List[DabService]:
         """Get other service list (opposite of current)."""
+        index = self.ensemble.get_index()
         if not self.transmitting_audio:
-            return [s for s in self.ensemble.services if s.id < 0x10000]
+            return index.programme_services
         else:
-            return [s for s in self.ensemble.services if s.id >= 0x10000]
+            return index.data_services
 
     def repetition_rate(self) -> FIGRate:
         """FIG 0/2 transmitted at rate A_B."""
@@ -589,8 +656,8 @@ class FIG0_3(FIGBase):
                     return status
 
         # Reserve space for header
-        pos = 2
-        bytes_written_data = 0
+        pos: int = 2
+        bytes_written_data: int = 0
 
         while self.service_index < len(services):
             service = services[self.service_index]
@@ -619,7 +686,7 @@ class FIG0_3(FIGBase):
                 # Programme service (16-bit SId): 3 bytes
                 # Bytes 0-1: SId (16-bit, big-endian)
                 # Byte 2: Local flag (1) | CAId (3) | NbServiceComp (4)
-                struct.pack_into('>H', buf, pos, service.id & 0xFFFF)
+                _pack_h_into(buf, pos, service.id & 0xFFFF)
                 buf[pos + 2] = (0 << 7) | (0 << 4) | (num_components & 0x0F)  # Local=0, CAId=0
                 pos += 3
                 bytes_written_data += 3
@@ -627,7 +694,7 @@ class FIG0_3(FIGBase):
                 # Data service (32-bit SId): 5 bytes
                 # Bytes 0-3: SId (32-bit, big-endian)
                 # Byte 4: Local flag (1) | CAId (3) | NbServiceComp (4)
-                struct.pack_into('>I', buf, pos, service.id)
+                _pack_i_into(buf, pos, service.id)
                 buf[pos + 4] = (0 << 7) | (0 << 4) | (num_components & 0x0F)
                 pos += 5
                 bytes_written_data += 5
@@ -695,12 +762,13 @@ class FIG0_3(FIGBase):
 
     def _get_current_service_list(self) -> List[DabService]:
         """Get current service list (programme or data) with packet components."""
+        index = self.ensemble.get_index()
         if self.transmitting_programme:
             # Programme services with packet components
-            services = [s for s in self.ensemble.services if s.id < 0x10000]
+            services = index.programme_services
         else:
             # Data services with packet components
-            services = [s for s in self.ensemble.services if s.id >= 0x10000]
+            services = index.data_services
 
         # Filter to only services that have packet mode components
         return [s for s in services if any(
@@ -710,10 +778,11 @@ class FIG0_3(FIGBase):
 
     def _get_other_service_list(self) -> List[DabService]:
         """Get other service list (opposite of current) with packet components."""
+        index = self.ensemble.get_index()
         if not self.transmitting_programme:
-            services = [s for s in self.ensemble.services if s.id < 0x10000]
+            services = index.programme_services
         else:
-            services = [s for s in self.ensemble.services if s.id >= 0x10000]
+            services = index.data_services
 
         # Filter to only services that have packet mode components
         return [s for s in services if any(
@@ -750,17 +819,26 @@ class FIG0_5(FIGBase):
         super().__init__()
         self.ensemble = ensemble
 
-    def fill(self, buf: bytearray, max_size: int) -> int:
+    def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
-        Fill FIG 0/5 data.
+        Fill buffer with FIG 0/5 data.
 
         Format for short form (MSC sub-channel):
         - LS (1 bit): Long/Short form (0=short)
         - SubChId (6 bits): Sub-channel ID
         - Language (8 bits): Language code
         """
-        start_size = len(buf)
-        remaining = max_size
+        status = FillStatus()
+
+        if max_size < 2:
+            return status
+
+        remaining = max_size - 2
+
+        subchannel_by_id = self.ensemble.get_index().subchannel_by_id
+
+        # Accumulate the payload locally, then write after the header
+        local = bytearray()
 
         # For each service, output language for its components
         for service in self.ensemble.services:
@@ -772,27 +850,38 @@ class FIG0_5(FIGBase):
 
             for comp in components:
                 # Find subchannel for this component
-                subchannels = [s for s in self.ensemble.subchannels if s.id == comp.subchannel_id]
-                if not subchannels:
+                subchannel = subchannel_by_id.get(comp.subchannel_id)
+                if subchannel is None:
                     continue
 
-                subchannel = subchannels[0]
-
                 # Need 2 bytes for short form
                 if remaining < 2:
                     break
 
-                # Short form: LS=0, SubChId (6 bits)
-                buf.append((0 << 7) | (subchannel.id & 0x3F))
-                # Language code (8 bits)
-                buf.append(service.language & 0xFF)
+                # Short form: LS=0, SubChId (6 bits), then language code
+                local += _pack_bb((0 << 7) | (subchannel.id & 0x3F),
+                                  service.language & 0xFF)
 
                 remaining -= 2
 
             if remaining < 2:
                 break
 
-        return len(buf) - start_size
+        if not local:
+            status.complete_fig_transmitted = True
+            return status
+
+        # FIG header
+        fig_type = 0
+        length = len(local) + 1  # +1 for second header byte
+        buf[0] = (fig_type << 5) | (length & 0x1F)
+        buf[1] = 5  # CN=0, OE=0, PD=0, Extension=5
+
+        buf[2:2 + len(local)] = local
+
+        status.num_bytes_written = 2 + len(local)
+        status.complete_fig_transmitted = True
+        return status
 
     def repetition_rate(self) -> FIGRate:
         """FIG 0/5 transmitted at rate B."""
@@ -819,9 +908,9 @@ class FIG0_8(FIGBase):
         super().__init__()
         self.ensemble = ensemble
 
-    def fill(self, buf: bytearray, max_size: int) -> int:
+    def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
-        Fill FIG 0/8 data.
+        Fill buffer with FIG 0/8 data.
 
         Format:
         - Ext (3 bits): Extension flag (0)
@@ -830,8 +919,17 @@ class FIG0_8(FIGBase):
         - SubChId (6 bits): Sub-channel ID
         - FIDCId (6 bits): Fast Information Data Channel Identifier
         """
-        start_size = len(buf)
-        remaining = max_size
+        status = FillStatus()
+
+        if max_size < 2:
+            return status
+
+        remaining = max_size - 2
+
+        subchannel_by_id = self.ensemble.get_index().subchannel_by_id
+
+        # Accumulate into a local bytearray and extend buf once at the end
+        local = bytearray()
 
         # For each service component
         scids = 0
@@ -840,23 +938,20 @@ class FIG0_8(FIGBase):
 
             for comp in components:
                 # Find subchannel
-                subchannels = [s for s in self.ensemble.subchannels if s.id == comp.subchannel_id]
-                if not subchannels:
+                subchannel = subchannel_by_id.get(comp.subchannel_id)
+                if subchannel is None:
                     continue
 
-                subchannel = subchannels[0]
-
                 # Need 2 bytes
                 if remaining < 2:
                     break
 
                 # Byte 1: Ext(3) + SCIdS(4) + LS(1)
                 # Ext=0 (no extension), LS=0 (short form)
-                buf.append((0 << 5) | ((scids & 0x0F) << 1) | 0)
-
                 # Byte 2: SubChId(6) + FIDCId_high(2)
                 # FIDCId is typically 0 for audio services
-                buf.append((subchannel.id & 0x3F) << 2)
+                local += _pack_bb((0 << 5) | ((scids & 0x0F) << 1) | 0,
+                                  (subchannel.id & 0x3F) << 2)
 
                 remaining -= 2
                 scids = (scids + 1) & 0x0F
@@ -864,7 +959,21 @@ class FIG0_8(FIGBase):
             if remaining < 2:
                 break
 
-        return len(buf) - start_size
+        if not local:
+            status.complete_fig_transmitted = True
+            return status
+
+        # FIG header
+        fig_type = 0
+        length = len(local) + 1  # +1 for second header byte
+        buf[0] = (fig_type << 5) | (length & 0x1F)
+        buf[1] = 8  # CN=0, OE=0, PD=0, Extension=8
+
+        buf[2:2 + len(local)] = local
+
+        status.num_bytes_written = 2 + len(local)
+        status.complete_fig_transmitted = True
+        return status
 
     def repetition_rate(self) -> FIGRate:
         """FIG 0/8 transmitted at rate B."""
@@ -1095,8 +1204,8 @@ class FIG0_14(FIGBase):
         start_pos = 0
 
         # Reserve space for header (will be filled later)
-        pos = 2
-        bytes_written_data = 0
+        pos: int = 2
+        bytes_written_data: int = 0
 
         # Iterate through FEC subchannels
         while self.subchannel_index < len(fec_subchannels):
@@ -1176,9 +1285,9 @@ class FIG0_17(FIGBase):
         super().__init__()
         self.ensemble = ensemble
 
-    def fill(self, buf: bytearray, max_size: int) -> int:
+    def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
-        Fill FIG 0/17 data.
+        Fill buffer with FIG 0/17 data.
 
         Format:
         - SId (16 or 32 bits): Service Identifier
@@ -1190,8 +1299,17 @@ class FIG0_17(FIGBase):
         - Int code (8 bits): International code (PTy)
         - Comp code (8 bits): Complementary code (optional)
         """
-        start_size = len(buf)
-        remaining = max_size
+        status = FillStatus()
+
+        if max_size < 2:
+            return status
+
+        remaining = max_size - 2
+
+        sid_bytes = self.ensemble.get_index().sid_bytes
+
+        # Accumulate into a local bytearray and extend buf once at the end
+        local = bytearray()
 
         for service in self.ensemble.services:
             if service.pty_settings.pty == 0:
@@ -1205,28 +1323,31 @@ class FIG0_17(FIGBase):
             if remaining < size_needed:
                 break
 
-            # Service ID (16 or 32 bits)
-            if service.id < 0x10000:
-                # 16-bit SId
-                buf.append((service.id >> 8) & 0xFF)
-                buf.append(service.id & 0xFF)
-            else:
-                # 32-bit SId
-                buf.append((service.id >> 24) & 0xFF)
-                buf.append((service.id >> 16) & 0xFF)
-                buf.append((service.id >> 8) & 0xFF)
-                buf.append(service.id & 0xFF)
+            # Service ID (16 or 32 bits, pre-serialized on the index)
+            local += sid_bytes[service.id]
 
             # Flags byte: SD(1) + PS(1) + L/S(1) + CC(1) + Rfa(4)
             # SD=0 (static), PS=0 (primary), L/S=0, CC=0, Rfa=0
-            buf.append(0x00)
-
-            # International code (PTy)
-            buf.append(service.pty_settings.pty & 0xFF)
+            # then the international code (PTy)
+            local += _pack_bb(0x00, service.pty_settings.pty & 0xFF)
 
             remaining -= size_needed
 
-        return len(buf) - start_size
+        if not local:
+            status.complete_fig_transmitted = True
+            return status
+
+        # FIG header
+        fig_type = 0
+        length = len(local) + 1  # +1 for second header byte
+        buf[0] = (fig_type << 5) | (length & 0x1F)
+        buf[1] = 17  # CN=0, OE=0, PD=0, Extension=17
+
+        buf[2:2 + len(local)] = local
+
+        status.num_bytes_written = 2 + len(local)
+        status.complete_fig_transmitted = True
+        return status
 
     def repetition_rate(self) -> FIGRate:
         """FIG 0/17 transmitted at rate B."""
@@ -1313,7 +1434,7 @@ class FIG0_9(FIGBase):
             pos += 1
 
             # Bytes 1-2: Service ID (big-endian)
-            struct.pack_into('>H', buf, pos, service.id)
+            _pack_h_into(buf, pos, service.id)
             pos += 2
 
             # Byte 3: ECC (use service-specific or ensemble ECC)
@@ -1558,7 +1679,7 @@ class FIG0_18(FIGBase):
                 break
 
             # Bytes 0-1: Service ID (big-endian)
-            struct.pack_into('>H', buf, pos, service.id)
+            _pack_h_into(buf, pos, service.id)
             pos += 2
 
             # Bytes 2-3: ASU flags (announcement support)
@@ -1569,7 +1690,7 @@ class FIG0_18(FIGBase):
                 if bit_pos is not None:
                     asu |= (1 << bit_pos)
 
-            struct.pack_into('>H', buf, pos, asu)
+            _pack_h_into(buf, pos, asu)
             pos += 2
 
             # Byte 4: Cluster count (5 bits) + New flag + Region flag
@@ -1698,7 +1819,7 @@ class FIG0_19(FIGBase):
                 if bit_pos is not None:
                     asu |= (1 << bit_pos)
 
-            struct.pack_into('>H', buf, pos, asu)
+            _pack_h_into(buf, pos, asu)
             pos += 2
 
             # Byte 3: SubChId (6 bits) + Region flag + New flag
@@ -1837,7 +1958,7 @@ class FIG0_21(FIGBase):
                     break
 
                 # Bytes 0-1: Service ID (big-endian)
-                struct.pack_into('>H', buf, pos, service.id)
+                _pack_h_into(buf, pos, service.id)
                 pos += 2
 
                 # Byte 2: ListId (4 bits) + R flag + Continuity (2 bits) + spare
@@ -1855,7 +1976,7 @@ class FIG0_21(FIGBase):
                 # Frequency entries (2 bytes each)
                 for freq_entry in freq_list.frequencies:
                     encoded_freq = self._encode_frequency(freq_entry)
-                    struct.pack_into('>H', buf, pos, encoded_freq)
+                    _pack_h_into(buf, pos, encoded_freq)
                     pos += 2
 
                 self.list_index += 1
@@ -2022,7 +2143,7 @@ class FIG0_24(FIGBase):
             pos += 1
 
             # Bytes 1-2: Ensemble ID (big-endian)
-            struct.pack_into('>H', buf, pos, ens_id)
+            _pack_h_into(buf, pos, ens_id)
             pos += 2
 
             # Byte 3: Number of services (5 bits) + CAId flag (1) + Rfa (2)
@@ -2036,11 +2157,11 @@ class FIG0_24(FIGBase):
             for svc in services:
                 if svc.is_32bit_sid:
                     # 32-bit Service ID (big-endian)
-                    struct.pack_into('>I', buf, pos, svc.service_id)
+                    _pack_i_into(buf, pos, svc.service_id)
                     pos += 4
                 else:
                     # 16-bit Service ID (big-endian)
-                    struct.pack_into('>H', buf, pos, svc.service_id)
+                    _pack_h_into(buf, pos, svc.service_id)
                     pos += 2
 
                 # Skip CAId for now (ca_flag = 0)
@@ -2178,7 +2299,7 @@ class FIG0_6(FIGBase):
                     break
 
                 # Bytes 0-1: Service ID (big-endian)
-                struct.pack_into('>H', buf, pos, service.id)
+                _pack_h_into(buf, pos, service.id)
                 pos += 2
 
                 # Byte 2: IdLQ (2 bits) + LSN high (6 bits)
@@ -2282,17 +2403,17 @@ class FIG0_6(FIGBase):
             pos += 1
 
             # Bytes 1-2: Ensemble ID (big-endian)
-            struct.pack_into('>H', buf, pos, link.target_ensemble_id)
+            _pack_h_into(buf, pos, link.target_ensemble_id)
             pos += 2
 
             # Service ID (16 or 32 bits)
             if link.target_service_id >= 0x10000:
                 # 32-bit
-                struct.pack_into('>I', buf, pos, link.target_service_id)
+                _pack_i_into(buf, pos, link.target_service_id)
                 pos += 4
             else:
                 # 16-bit
-                struct.pack_into('>H', buf, pos, link.target_service_id)
+                _pack_h_into(buf, pos, link.target_service_id)
                 pos += 2
 
         elif link.idlq == 1:  # RDS/FM
@@ -2300,7 +2421,7 @@ class FIG0_6(FIGBase):
                 # RDS: Type(0) + PI code
                 buf[pos] = 0x00  # Type = RDS
                 pos += 1
-                struct.pack_into('>H', buf, pos, link.rds_pi_code)
+                _pack_h_into(buf, pos, link.rds_pi_code)
                 pos += 2
             else:
                 # FM: Type(1) + Frequency
@@ -2308,17 +2429,17 @@ class FIG0_6(FIGBase):
                 pos += 1
                 # Encode FM frequency: (MHz - 87.5) * 200
                 encoded_freq = int((link.fm_frequency_mhz - 87.5) * 200)
-                struct.pack_into('>H', buf, pos, encoded_freq)
+                _pack_h_into(buf, pos, encoded_freq)
                 pos += 2
 
         elif link.idlq == 2:  # DRM
             # 32-bit Service ID
-            struct.pack_into('>I', buf, pos, link.drm_service_id)
+            _pack_i_into(buf, pos, link.drm_service_id)
             pos += 4
 
         elif link.idlq == 3:  # AMSS
             # 32-bit Service ID
-            struct.pack_into('>I', buf, pos, link.drm_service_id)
+            _pack_i_into(buf, pos, link.drm_service_id)
             pos += 4
 
         return pos
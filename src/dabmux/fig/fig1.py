@@ -8,6 +8,12 @@ import struct
 from dabmux.fig.base import FIGBase, FIGRate, FillStatus, FIGPriority
 from dabmux.core.mux_elements import DabEnsemble
 
+# Bound pack_into of precompiled Structs, shared by all label FIGs.
+# _pack_label_into writes an id/flags byte pair, the 16-byte label and the
+# short-label flag word in one native call.
+_pack_h_into = struct.Struct('>H').pack_into
+_pack_label_into = struct.Struct('>H16sH').pack_into
+
 
 class FIG1_0(FIGBase):
     """
@@ -28,6 +34,43 @@ class FIG1_0(FIGBase):
         """
         super().__init__()
         self.ensemble = ensemble
+        self._template = b''
+        self._template_key = None
+
+    def _get_template(self) -> bytes:
+        """
+        Return the serialized 22-byte FIG, rebuilt when the label changes.
+
+        The ensemble label is effectively static, so the whole FIG is
+        cached and fill() reduces to one slice copy.
+        """
+        label = self.ensemble.label
+        key = (self.ensemble.id, label.text, label.flag)
+        if key != self._template_key:
+            template = bytearray(22)
+
+            # FIG header (2 bytes)
+            fig_type = 1
+            length = 21  # 21 bytes of data after header
+            oe = 0       # This ensemble
+            charset = 0  # EBU Latin charset
+            extension = 0
+
+            template[0] = (fig_type << 5) | (length & 0x1F)
+            template[1] = (charset << 4) | (oe << 3) | (extension & 0x07)
+
+            # Ensemble ID (2 bytes, big-endian)
+            _pack_h_into(template, 2, self.ensemble.id)
+
+            # Label (16 bytes)
+            template[4:20] = label.to_ebu_latin()
+
+            # Short label flag (2 bytes, big-endian)
+            _pack_h_into(template, 20, label.flag)
+
+            self._template = bytes(template)
+            self._template_key = key
+        return self._template
 
     def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
@@ -51,25 +94,7 @@ class FIG1_0(FIGBase):
         if max_size < 22:
             return status
 
-        # FIG header (2 bytes)
-        fig_type = 1
-        length = 21  # 21 bytes of data after header
-        oe = 0       # This ensemble
-        charset = 0  # EBU Latin charset
-        extension = 0
-
-        buf[0] = (fig_type << 5) | (length & 0x1F)
-        buf[1] = (charset << 4) | (oe << 3) | (extension & 0x07)
-
-        # Ensemble ID (2 bytes, big-endian)
-        struct.pack_into('>H', buf, 2, self.ensemble.id)
-
-        # Label (16 bytes)
-        label_bytes = self.ensemble.label.to_ebu_latin()
-        buf[4:20] = label_bytes
-
-        # Short label flag (2 bytes, big-endian)
-        struct.pack_into('>H', buf, 20, self.ensemble.label.flag)
+        buf[0:22] = self._get_template()
 
         status.num_bytes_written = 22
         status.complete_fig_transmitted = True
@@ -111,7 +136,9 @@ class FIG1_1(FIGBase):
         """
         super().__init__()
         self.ensemble = ensemble
-        self.service_index = 0
+        # Persistent iterator over programme services; None between cycles
+        self._services_iter = None
+        self._pending_service = None
         self._initial_announcement_complete = False
 
     def fill(self, buf: bytearray, max_size: int) -> FillStatus:
@@ -128,7 +155,7 @@ class FIG1_1(FIGBase):
         status = FillStatus()
 
         # Get programme services (16-bit SId)
-        programme_services = [s for s in self.ensemble.services if s.id < 0x10000]
+        programme_services = self.ensemble.get_index().programme_services
 
         if not programme_services:
             status.complete_fig_transmitted = True
@@ -138,37 +165,51 @@ class FIG1_1(FIGBase):
             return status
 
         # Reserve space for header
-        pos = 2
-        bytes_written_data = 0
-
-        # Each service label: 2 (SId) + 16 (label) + 2 (flag) = 20 bytes
-        while self.service_index < len(programme_services):
-            service = programme_services[self.service_index]
+        pos: int = 2
+        bytes_written_data: int = 0
+
+        # Resume the persistent iterator, or start a new cycle
+        it = self._services_iter
+        if it is None:
+            it = self._services_iter = iter(programme_services)
+
+        # Each service label: 2 (SId) + 16 (label) + 2 (flag) = 20 bytes.
+        # All entries are the same size, so the number that fit is known up
+        # front; no per-iteration bound check is needed.
+        entries_left = (max_size - 2) // 20
+        exhausted = False
+
+        while entries_left > 0:
+            service = self._pending_service
+            if service is not None:
+                self._pending_service = None
+            else:
+                service = next(it, None)
+                if service is None:
+                    exhausted = True
+                    break
+            label = service.label
 
             # Check if service has a label
-            if not service.label.text:
-                self.service_index += 1
+            if not label.text:
                 continue
 
-            # Need 20 bytes for service label
-            if pos + 20 > max_size:
-                break
-
-            # Service ID (2 bytes, big-endian)
-            struct.pack_into('>H', buf, pos, service.id & 0xFFFF)
-            pos += 2
+            # SId (2 bytes) + label (16 bytes) + short label flag (2 bytes)
+            _pack_label_into(buf, pos, service.id & 0xFFFF,
+                             label.to_ebu_latin(), label.flag)
+            pos += 20
 
-            # Label (16 bytes)
-            label_bytes = service.label.to_ebu_latin()
-            buf[pos:pos+16] = label_bytes
-            pos += 16
+            bytes_written_data += 20
+            entries_left -= 1
 
-            # Short label flag (2 bytes, big-endian)
-            struct.pack_into('>H', buf, pos, service.label.flag)
-            pos += 2
+        if not exhausted and self._pending_service is None:
+            # Probe ahead so a fill that emits the final label still
+            # reports completion; an unwritten service is kept pending
+            self._pending_service = next(it, None)
+            exhausted = self._pending_service is None
 
-            bytes_written_data += 20
-            self.service_index += 1
+        if exhausted:
+            self._services_iter = None
 
         if bytes_written_data == 0:
             return status
@@ -186,8 +227,7 @@ class FIG1_1(FIGBase):
         status.num_bytes_written = 2 + bytes_written_data
 
         # Check if complete
-        if self.service_index >= len(programme_services):
-            self.service_index = 0
+        if exhausted:
             status.complete_fig_transmitted = True
             self._initial_announcement_complete = True
 
@@ -235,7 +275,9 @@ class FIG1_4(FIGBase):
         """
         super().__init__()
         self.ensemble = ensemble
-        self.component_index = 0
+        # Persistent iterator over components; None between cycles
+        self._components_iter = None
+        self._pending_component = None
 
     def fill(self, buf: bytearray, max_size: int) -> FillStatus:
         """
@@ -258,20 +300,35 @@ class FIG1_4(FIGBase):
             return status
 
         # Reserve space for header
-        pos = 2
-        bytes_written_data = 0
+        pos: int = 2
+        bytes_written_data: int = 0
+
+        # Resume the persistent iterator, or start a new cycle
+        it = self._components_iter
+        if it is None:
+            it = self._components_iter = iter(self.ensemble.components)
+
+        exhausted = False
 
         # Each component label: 1 (PD) + 2 (SCIdS + SubChId) + 16 (label) + 2 (flag) = 21 bytes
-        while self.component_index < len(self.ensemble.components):
-            component = self.ensemble.components[self.component_index]
+        while True:
+            component = self._pending_component
+            if component is not None:
+                self._pending_component = None
+            else:
+                component = next(it, None)
+                if component is None:
+                    exhausted = True
+                    break
 
             # Check if component has a label
             if not component.label.text:
-                self.component_index += 1
                 continue
 
             # Need 21 bytes for component label
             if pos + 21 > max_size:
+                # Not written; keep it for the next fill
+                self._pending_component = component
                 break
 
             # PD flag and SCIdS (1 byte)
@@ -279,24 +336,20 @@ class FIG1_4(FIGBase):
             pd = 0  # Assume programme for now
             scids = component.scids & 0x0F
 
-            buf[pos] = (pd << 7) | (scids & 0x0F)
-            pos += 1
-
-            # SubChId or other identifier (1 byte)
-            buf[pos] = component.subchannel_id & 0xFF
-            pos += 1
-
-            # Label (16 bytes)
-            label_bytes = component.label.to_ebu_latin()
-            buf[pos:pos+16] = label_bytes
-            pos += 16
-
-            # Short label flag (2 bytes, big-endian)
-            struct.pack_into('>H', buf, pos, component.label.flag)
-            pos += 2
+            # PD/SCIdS byte + SubChId byte, then label (16 bytes) and
+            # short label flag (2 bytes), written in one call; the pad
+            # byte brings the entry to the 21 bytes reported in the FIG
+            # length, so every reported byte is explicitly written
+            ident = ((pd << 7) | (scids & 0x0F)) << 8 | (component.subchannel_id & 0xFF)
+            label = component.label
+            _pack_label_into(buf, pos, ident, label.to_ebu_latin(), label.flag)
+            buf[pos + 20] = 0
+            pos += 21
 
             bytes_written_data += 21
-            self.component_index += 1
+
+        if exhausted:
+            self._components_iter = None
 
         if bytes_written_data == 0:
             return status
@@ -314,8 +367,7 @@ class FIG1_4(FIGBase):
         status.num_bytes_written = 2 + bytes_written_data
 
         # Check if complete
-        if self.component_index >= len(self.ensemble.components):
-            self.component_index = 0
+        if exhausted:
             status.complete_fig_transmitted = True
 
         return status
@@ -6,9 +6,33 @@ must inherit from.
 """
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Optional
+from typing import Dict, Optional
 import time
 
+# Shared per-size silence frames. Underruns return identical zero-filled
+# data every 24 ms, so one immutable bytes object per size is cached and
+# handed out instead of allocating a fresh buffer each call.
+_silence_frames: Dict[int, bytes] = {}
+
+
+def silence_frame(size: int) -> bytes:
+    """
+    Return a zero-filled frame of the given size.
+
+    Frames are cached per size and shared between all inputs; bytes is
+    immutable, so sharing is safe.
+
+    Args:
+        size: Frame size in bytes
+
+    Returns:
+        Silence frame
+    """
+    frame = _silence_frames.get(size)
+    if frame is None:
+        frame = _silence_frames[size] = bytes(size)
+    return frame
+
 
 class BufferManagement(Enum):
     """
@@ -7,7 +7,7 @@ including MPEG, raw binary, and packet formats.
 import os
 import structlog
 from typing import Optional
-from dabmux.input.base import InputBase
+from dabmux.input.base import InputBase, silence_frame
 from dabmux.audio.mpeg import MpegFrameParser
 from dabmux.fec.reed_solomon import ReedSolomonDAB
 
@@ -217,7 +217,7 @@ class MPEGFileInput(FileInput):
             MPEG frame data (padded to size if needed)
         """
         if not self._is_open:
-            return bytes(size)  # Return silence
+            return silence_frame(size)  # Return silence
 
         # Read more data if buffer is low
         if len(self._read_buffer) < size + 2000:
@@ -236,7 +236,7 @@ class MPEGFileInput(FileInput):
                 if len(self._read_buffer) == 0:
                     # Still no data, return silence
                     logger.warning("MPEG input underrun", size=size)
-                    return bytes(size)
+                    return silence_frame(size)
 
         # Try to parse an MPEG frame
         result = self._parser.read_frame(bytes(self._read_buffer))
@@ -247,7 +247,7 @@ class MPEGFileInput(FileInput):
                 self._read_buffer.pop(0)
 
             logger.debug("No valid MPEG frame found")
-            return bytes(size)  # Return silence
+            return silence_frame(size)  # Return silence
 
         header, frame_data = result
         frame_length = len(frame_data)
@@ -272,12 +272,13 @@ class MPEGFileInput(FileInput):
                 length=frame_length
             )
 
-        # Adjust to requested size
+        # Adjust to requested size (frame_data is a view into the read
+        # buffer, so materialize it before the buffer is reused)
         if frame_length == size:
-            return frame_data
+            return bytes(frame_data)
         elif frame_length < size:
             # Pad with zeros
-            return frame_data + bytes(size - frame_length)
+            return bytes(frame_data) + bytes(size - frame_length)
         else:
             # Truncate
             logger.warning(
@@ -285,7 +286,7 @@ class MPEGFileInput(FileInput):
                 frame_size=frame_length,
                 requested=size
             )
-            return frame_data[:size]
+            return bytes(frame_data[:size])
 
     def set_bitrate(self, bitrate: int) -> int:
         """
@@ -362,7 +363,7 @@ class PacketFileInput(FileInput):
             Packet data (with RS parity if enhanced mode)
         """
         if not self._is_open:
-            return bytes(size)
+            return silence_frame(size)
 
         if self._enhanced_packet_mode:
             return self._read_enhanced_packet(size)
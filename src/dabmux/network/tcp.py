@@ -2,19 +2,92 @@
 TCP network input for DAB audio.
 
 This module provides TCP-based audio input with client connection handling
-and frame buffering.
+and frame buffering. All inputs share a single selector-based I/O thread
+instead of spawning accept/receive threads per input.
 """
+import re
+import selectors
 import socket
 import threading
 import struct
-from typing import Optional, List
-from urllib.parse import urlparse
+import time
+from typing import Callable, Optional, List
 import structlog
 
-from dabmux.input.base import InputBase
+from dabmux.input.base import InputBase, silence_frame
+from dabmux.utils.spsc import SpscByteRing
 
 logger = structlog.get_logger()
 
+# TCP_QUICKACK is Linux-only; the kernel disarms it after each ACK, so
+# it must be re-enabled per read to keep ACKs immediate
+_HAS_QUICKACK = hasattr(socket, 'TCP_QUICKACK')
+
+# tcp://host:port with an empty host meaning all interfaces; one
+# precompiled pattern replaces urlparse plus hand-rolled splitting
+_TCP_URL_RE = re.compile(r'^tcp://(?P<host>[^:/]*):(?P<port>\d+)$')
+
+
+class TcpInputReactor:
+    """
+    Shared selector loop for all TCP inputs.
+
+    One daemon thread multiplexes every registered socket (servers and
+    clients) through a single selector, so N inputs cost one thread
+    instead of 2N blocking threads with timeout wakeups.
+    """
+
+    _instance: Optional['TcpInputReactor'] = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get(cls) -> 'TcpInputReactor':
+        """Get the process-wide reactor, creating it on first use."""
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls()
+            return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize the reactor (use get() rather than constructing)."""
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    def register(self, sock: socket.socket, callback: Callable[[], None]) -> None:
+        """
+        Register a socket; callback runs on the reactor thread when readable.
+
+        The socket is switched to non-blocking mode.
+        """
+        sock.setblocking(False)
+        with self._lock:
+            self._selector.register(sock, selectors.EVENT_READ, callback)
+            if self._thread is None or not self._thread.is_alive():
+                self._running = True
+                self._thread = threading.Thread(
+                    target=self._run, daemon=True, name="tcp-input-reactor")
+                self._thread.start()
+
+    def unregister(self, sock: socket.socket) -> None:
+        """Remove a socket from the reactor; safe if already removed."""
+        with self._lock:
+            try:
+                self._selector.unregister(sock)
+            except (KeyError, ValueError):
+                pass
+
+    def _run(self) -> None:
+        """Reactor loop: dispatch readable sockets to their callbacks."""
+        while self._running:
+            events = self._selector.select(timeout=0.5)
+            for key, _ in events:
+                try:
+                    key.data()
+                except Exception as e:
+                    logger.error("TCP reactor callback error", error=str(e))
+
 
 class TcpInput(InputBase):
     """
@@ -24,8 +97,10 @@ class TcpInput(InputBase):
     and receiving audio frame data.
     """
 
-    # TCP receive block size
-    TCP_BLOCKSIZE = 2048
+    # TCP receive block size. Large enough that a bitrate-bound encoder
+    # feed needs few syscalls per second; the kernel hands over whatever
+    # is available, so small payloads are unaffected.
+    TCP_BLOCKSIZE = 65536
 
     def __init__(self, prebuffer_frames: int = 5, max_buffer_bytes: int = 1024 * 1024) -> None:
         """
@@ -41,17 +116,30 @@ class TcpInput(InputBase):
         self._host: str = ""
         self._port: int = 0
 
-        # Frame buffering
-        self._accumulation_buffer = bytearray()
+        # Frame buffering: a lock-free single-producer single-consumer
+        # ring between the reactor thread and the frame reader
+        self._ring = SpscByteRing(max_buffer_bytes)
+
+        # Scratch region for recv_into, avoiding a bytes allocation per recv
+        self._recv_scratch = bytearray(self.TCP_BLOCKSIZE)
+        self._recv_view = memoryview(self._recv_scratch)
         self._prebuffer_frames = prebuffer_frames
         self._max_buffer_bytes = max_buffer_bytes
         self._is_prebuffering = True
 
-        # Receive thread
-        self._receive_thread: Optional[threading.Thread] = None
-        self._accept_thread: Optional[threading.Thread] = None
+        # Set by the reactor on a new connection; the frame reader
+        # applies it, since only the consumer may clear the ring
+        self._ring_reset = False
+
         self._running = False
 
+        # Hot-path logger; rebound with static context in open() so
+        # per-frame events don't re-merge the same fields
+        self._log = logger
+        # Rate limiting for warnings that can repeat every frame
+        self._last_underrun_log = 0.0
+        self._last_overflow_log = 0.0
+
         # Statistics
         self._bytes_received = 0
         self._connections_accepted = 0
@@ -75,40 +163,39 @@ class TcpInput(InputBase):
         if not name.startswith("tcp://"):
             raise ValueError(f"Invalid TCP URL: {name}")
 
-        url = urlparse(name)
-        netloc = url.netloc
-
-        if ':' in netloc:
-            if netloc.startswith(':'):
-                # Bind all interfaces
-                self._host = ''
-                port_str = netloc[1:]
-            else:
-                # Specific host
-                host_port = netloc.rsplit(':', 1)
-                self._host = host_port[0]
-                port_str = host_port[1]
-        else:
+        match = _TCP_URL_RE.match(name)
+        if not match:
             raise ValueError(f"Invalid TCP URL format: {name}")
 
-        try:
-            self._port = int(port_str)
-        except ValueError:
-            raise ValueError(f"Invalid port number: {port_str}")
+        # An empty host binds all interfaces
+        self._host = match['host']
+        self._port = int(match['port'])
 
         # Create TCP server socket
         try:
             self._server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # Port sharing lets a restarted mux rebind without a race and
+            # allows sibling workers to listen on the same port
+            if hasattr(socket, 'SO_REUSEPORT'):
+                self._server_socket.setsockopt(
+                    socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            # SO_RCVBUF is deliberately left untouched so the kernel can
+            # autotune the receive window for the path
             self._server_socket.bind((self._host, self._port))
-            self._server_socket.listen(1)  # Single client
+            # A deeper backlog absorbs encoder reconnect bursts; only one
+            # client is served at a time regardless
+            self._server_socket.listen(128)
 
             self._is_open = True
             self._running = True
 
-            # Start accept thread
-            self._accept_thread = threading.Thread(target=self._accept_loop, daemon=True)
-            self._accept_thread.start()
+            # Bind static context once; hot-path calls pass only the
+            # dynamic fields
+            self._log = logger.bind(input="tcp", port=self._port)
+
+            # Hand the server socket to the shared reactor
+            TcpInputReactor.get().register(self._server_socket, self._on_accept_ready)
 
             logger.info(
                 "TCP server started",
@@ -137,9 +224,11 @@ class TcpInput(InputBase):
     def close(self) -> None:
         """Close TCP input."""
         self._running = False
+        reactor = TcpInputReactor.get()
 
         # Close client connection
         if self._client_socket:
+            reactor.unregister(self._client_socket)
             try:
                 self._client_socket.close()
             except:
@@ -148,21 +237,13 @@ class TcpInput(InputBase):
 
         # Close server socket
         if self._server_socket:
+            reactor.unregister(self._server_socket)
             try:
                 self._server_socket.close()
             except:
                 pass
             self._server_socket = None
 
-        # Wait for threads
-        if self._accept_thread:
-            self._accept_thread.join(timeout=2.0)
-            self._accept_thread = None
-
-        if self._receive_thread:
-            self._receive_thread.join(timeout=2.0)
-            self._receive_thread = None
-
         self._is_open = False
 
         logger.info(
@@ -171,103 +252,108 @@ class TcpInput(InputBase):
             connections=self._connections_accepted
         )
 
-    def _accept_loop(self) -> None:
-        """Background thread for accepting client connections."""
-        if not self._server_socket:
+    def _on_accept_ready(self) -> None:
+        """Reactor callback: the server socket has a pending connection."""
+        if not self._running or not self._server_socket:
             return
 
-        # Set timeout for clean shutdown
-        self._server_socket.settimeout(1.0)
+        try:
+            client_sock, client_addr = self._server_socket.accept()
+        except (BlockingIOError, OSError):
+            return
 
-        while self._running:
-            try:
-                # Accept connection
-                client_sock, client_addr = self._server_socket.accept()
-
-                # Close previous client if exists
-                if self._client_socket:
-                    logger.info("Closing previous client", addr=self._client_addr)
-                    self._client_socket.close()
-
-                # Set new client
-                self._client_socket = client_sock
-                self._client_addr = client_addr
-                self._connections_accepted += 1
-
-                logger.info(
-                    "TCP client connected",
-                    addr=client_addr,
-                    total_connections=self._connections_accepted
-                )
+        # Encoders send small periodic frames; without TCP_NODELAY,
+        # Nagle can delay them by up to a whole DAB frame
+        try:
+            client_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError:
+            pass
 
-                # Start receive thread for this client
-                if self._receive_thread and self._receive_thread.is_alive():
-                    # Wait for previous thread to finish
-                    self._receive_thread.join(timeout=1.0)
+        reactor = TcpInputReactor.get()
 
-                self._receive_thread = threading.Thread(
-                    target=self._receive_loop,
-                    daemon=True
-                )
-                self._receive_thread.start()
+        # Close previous client if exists
+        if self._client_socket:
+            logger.info("Closing previous client", addr=self._client_addr)
+            reactor.unregister(self._client_socket)
+            self._client_socket.close()
 
-                # Reset prebuffering
-                self._is_prebuffering = True
-                self._accumulation_buffer.clear()
-
-            except socket.timeout:
-                # Normal timeout, continue
-                continue
-            except Exception as e:
-                if self._running:
-                    logger.error("TCP accept error", error=str(e))
-
-    def _receive_loop(self) -> None:
-        """Background thread for receiving data from client."""
-        if not self._client_socket:
-            return
+        # Set new client
+        self._client_socket = client_sock
+        self._client_addr = client_addr
+        self._connections_accepted += 1
 
-        # Set socket timeout
-        self._client_socket.settimeout(5.0)
+        logger.info(
+            "TCP client connected",
+            addr=client_addr,
+            total_connections=self._connections_accepted
+        )
 
-        try:
-            while self._running and self._client_socket:
-                # Receive data
-                data = self._client_socket.recv(self.TCP_BLOCKSIZE)
-
-                if not data:
-                    # Client disconnected
-                    logger.info("TCP client disconnected", addr=self._client_addr)
-                    break
-
-                self._bytes_received += len(data)
-
-                # Check buffer size limit
-                if len(self._accumulation_buffer) + len(data) > self._max_buffer_bytes:
-                    # Buffer overflow - drop oldest data
-                    overflow = len(self._accumulation_buffer) + len(data) - self._max_buffer_bytes
-                    logger.warning(
-                        "TCP buffer overflow, dropping data",
-                        overflow_bytes=overflow
-                    )
-                    self._accumulation_buffer = self._accumulation_buffer[overflow:]
+        # Reset prebuffering; the ring itself is cleared by the frame
+        # reader on its own thread, as clear() moves the consumer
+        # counter and this is the producer side
+        self._is_prebuffering = True
+        self._ring_reset = True
 
-                # Add to buffer
-                self._accumulation_buffer.extend(data)
+        reactor.register(client_sock, self._on_client_ready)
 
-        except socket.timeout:
-            logger.warning("TCP receive timeout", addr=self._client_addr)
-        except Exception as e:
+    def _on_client_ready(self) -> None:
+        """Reactor callback: the client socket has data (or closed)."""
+        sock = self._client_socket
+        if not self._running or sock is None:
+            return
+
+        try:
+            # Receive into the scratch buffer; only the filled span is
+            # copied out as the chunk that goes on the queue
+            received = sock.recv_into(self._recv_view)
+        except BlockingIOError:
+            return
+        except OSError as e:
             if self._running:
                 logger.error("TCP receive error", error=str(e))
-        finally:
-            # Close client socket
-            if self._client_socket:
-                try:
-                    self._client_socket.close()
-                except:
-                    pass
-                self._client_socket = None
+            self._drop_client(sock)
+            return
+
+        if received == 0:
+            # Client disconnected
+            logger.info("TCP client disconnected", addr=self._client_addr)
+            self._drop_client(sock)
+            return
+
+        # Re-arm immediate ACKs so delayed ACKs don't stall the
+        # encoder's next send
+        if _HAS_QUICKACK:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            except OSError:
+                pass
+
+        self._bytes_received += received
+
+        # Hand the filled span straight to the ring; no intermediate
+        # bytes object is created
+        written = self._ring.write_from(self._recv_view[:received])
+        if written < received:
+            # Ring full - the newest data is dropped, since only the
+            # consumer may reclaim space. Rate-limited: a stalled
+            # consumer would otherwise log on every recv
+            now = time.monotonic()
+            if now - self._last_overflow_log > 1.0:
+                self._last_overflow_log = now
+                self._log.warning(
+                    "TCP buffer overflow, dropping data",
+                    overflow_bytes=received - written
+                )
+
+    def _drop_client(self, sock: socket.socket) -> None:
+        """Unregister and close a client socket."""
+        TcpInputReactor.get().unregister(sock)
+        try:
+            sock.close()
+        except:
+            pass
+        if self._client_socket is sock:
+            self._client_socket = None
 
     def read_frame(self, size: int) -> bytes:
         """
@@ -279,37 +365,52 @@ class TcpInput(InputBase):
         Returns:
             Frame data (or silence if unavailable)
         """
-        # Check if we have enough data
-        if len(self._accumulation_buffer) >= size:
+        ring = self._ring
+
+        # Apply a pending connection reset here, on the consumer
+        # thread; the flag is set before the new connection's first
+        # bytes can arrive, so this discards at most stale data
+        if self._ring_reset:
+            self._ring_reset = False
+            ring.clear()
+
+        # Check if we have enough data; the producer may only add more,
+        # so a positive check here cannot be invalidated concurrently
+        if len(ring) >= size:
             # Extract frame
-            frame_data = bytes(self._accumulation_buffer[:size])
-            self._accumulation_buffer = self._accumulation_buffer[size:]
+            out = bytearray(size)
+            ring.read_into(out)
 
             # Prebuffering logic
             if self._is_prebuffering:
                 # Wait for sufficient buffer
-                if len(self._accumulation_buffer) >= size * self._prebuffer_frames:
+                if len(ring) >= size * self._prebuffer_frames:
                     self._is_prebuffering = False
-                    logger.info(
+                    self._log.info(
                         "TCP prebuffering complete",
-                        buffer_frames=len(self._accumulation_buffer) // size
+                        buffer_frames=len(ring) // size
                     )
                 else:
                     # Still prebuffering, return silence
-                    return bytes(size)
+                    return silence_frame(size)
 
-            return frame_data
+            return bytes(out)
         else:
-            # Insufficient data - underrun
+            # Insufficient data - underrun; already edge-triggered on
+            # the prebuffering transition, rate-limited as well so a
+            # flapping input can't log every frame
             if not self._is_prebuffering:
-                logger.warning(
-                    "TCP input underrun",
-                    available=len(self._accumulation_buffer),
-                    needed=size
-                )
+                now = time.monotonic()
+                if now - self._last_underrun_log > 1.0:
+                    self._last_underrun_log = now
+                    self._log.warning(
+                        "TCP input underrun",
+                        available=len(ring),
+                        needed=size
+                    )
                 self._is_prebuffering = True
 
-            return bytes(size)
+            return silence_frame(size)
 
     def get_info(self) -> str:
         """
@@ -328,7 +429,7 @@ class TcpInput(InputBase):
         Returns:
             Buffer level
         """
-        return len(self._accumulation_buffer)
+        return len(self._ring)
 
     def is_connected(self) -> bool:
         """
@@ -348,7 +449,7 @@ class TcpInput(InputBase):
         """
         return {
             'bytes_received': self._bytes_received,
-            'buffer_bytes': len(self._accumulation_buffer),
+            'buffer_bytes': len(self._ring),
             'connections_accepted': self._connections_accepted,
             'client_connected': self.is_connected(),
             'client_addr': str(self._client_addr) if self._client_addr else None,
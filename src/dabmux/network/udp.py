@@ -11,7 +11,7 @@ from typing import Optional, Tuple
 from urllib.parse import urlparse
 import structlog
 
-from dabmux.input.base import InputBase, BufferManagement
+from dabmux.input.base import InputBase, BufferManagement, silence_frame
 from dabmux.utils.timestamp import FrameTimestamp
 
 logger = structlog.get_logger()
@@ -234,8 +234,10 @@ class UdpInput(InputBase):
         # Check if we have enough data in accumulation buffer
         if len(self._accumulation_buffer) >= size:
             # Extract frame
-            frame_data = bytes(self._accumulation_buffer[:size])
-            self._accumulation_buffer = self._accumulation_buffer[size:]
+            # One copy via memoryview; slicing the bytearray first would
+            # copy the frame twice
+            frame_data = bytes(memoryview(self._accumulation_buffer)[:size])
+            del self._accumulation_buffer[:size]
 
             # Prebuffering logic
             if self._is_prebuffering:
@@ -248,7 +250,7 @@ class UdpInput(InputBase):
                     )
                 else:
                     # Still prebuffering, return silence
-                    return bytes(size)
+                    return silence_frame(size)
 
             return frame_data
         else:
@@ -261,7 +263,7 @@ class UdpInput(InputBase):
                 )
                 self._is_prebuffering = True
 
-            return bytes(size)
+            return silence_frame(size)
 
     def get_info(self) -> str:
         """
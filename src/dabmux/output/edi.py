@@ -3,9 +3,12 @@ EDI output over UDP.
 
 This module implements EDI packet transmission over UDP with optional PFT.
 """
+import errno
 import socket
 import struct
-from typing import Optional
+import sys
+import time
+from typing import List, Optional
 from dabmux.output.base import DabOutput
 from dabmux.edi.protocol import AFPacket
 from dabmux.edi.pft import PFTConfig, PFTFragmenter
@@ -13,6 +16,14 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# UDP generic segmentation offload (Linux): one sendmsg carries the
+# concatenated fragments and the kernel splits them into datagrams of
+# the given segment size. Python only gained the constants recently,
+# so fall back to the kernel values.
+_SOL_UDP = getattr(socket, 'SOL_UDP', 17)
+_UDP_SEGMENT = getattr(socket, 'UDP_SEGMENT', 103)
+_GSO_SUPPORTED = hasattr(socket.socket, 'sendmsg') and sys.platform.startswith('linux')
+
 
 class EdiOutput(DabOutput):
     """
@@ -28,7 +39,9 @@ class EdiOutput(DabOutput):
         source_addr: str = "",
         source_port: int = 0,
         enable_pft: bool = False,
-        pft_config: Optional[PFTConfig] = None
+        pft_config: Optional[PFTConfig] = None,
+        sndbuf: Optional[int] = None,
+        multicast_iface: Optional[str] = None
     ) -> None:
         """
         Initialize EDI output.
@@ -40,6 +53,9 @@ class EdiOutput(DabOutput):
             source_port: Source UDP port
             enable_pft: Enable PFT fragmentation
             pft_config: PFT configuration (if enable_pft=True)
+            sndbuf: SO_SNDBUF size in bytes; None keeps the kernel default
+            multicast_iface: Local interface IP for outgoing multicast;
+                None lets the kernel pick via the routing table
         """
         super().__init__()
         self.dest_addr = dest_addr
@@ -47,6 +63,8 @@ class EdiOutput(DabOutput):
         self.source_addr = source_addr
         self.source_port = source_port
         self.enable_pft = enable_pft
+        self.sndbuf = sndbuf
+        self.multicast_iface = multicast_iface
 
         # Create socket
         self._socket: Optional[socket.socket] = None
@@ -61,6 +79,20 @@ class EdiOutput(DabOutput):
         self._packets_sent = 0
         self._bytes_sent = 0
         self._fragments_sent = 0
+        self._send_errors = 0
+
+        # Rate limiting for send-failure warnings, which a receiver
+        # outage would otherwise repeat every frame
+        self._last_send_error_log = 0.0
+
+        # Set after the kernel rejects UDP GSO, so write() stops retrying
+        self._gso_failed = False
+
+        # Reusable transmit buffer; packets and fragments are packed in
+        # place and sent as memoryview slices, avoiding a fresh bytes
+        # object per send
+        self._scratch = bytearray(65536)
+        self._scratch_view = memoryview(self._scratch)
 
     def open(self) -> None:
         """Open UDP socket."""
@@ -76,6 +108,11 @@ class EdiOutput(DabOutput):
             # Set socket options
             self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
+            # Only override the send buffer when explicitly requested;
+            # otherwise leave the kernel's autotuned default in place
+            if self.sndbuf is not None:
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.sndbuf)
+
             # Enable multicast if destination is multicast
             if self._is_multicast(self.dest_addr):
                 # Set multicast TTL
@@ -85,6 +122,26 @@ class EdiOutput(DabOutput):
                     struct.pack('b', 2)
                 )
 
+                # Don't loop outgoing packets back up the local stack
+                self._socket.setsockopt(
+                    socket.IPPROTO_IP,
+                    socket.IP_MULTICAST_LOOP,
+                    struct.pack('b', 0)
+                )
+
+                # Pin the outgoing interface when configured, skipping
+                # the per-packet routing decision
+                if self.multicast_iface:
+                    self._socket.setsockopt(
+                        socket.IPPROTO_IP,
+                        socket.IP_MULTICAST_IF,
+                        socket.inet_aton(self.multicast_iface)
+                    )
+
+            # Connect the socket so write() can use send() instead of
+            # sendto(), skipping the per-datagram destination lookup
+            self._socket.connect((self.dest_addr, self.dest_port))
+
             self._is_open = True
 
             logger.info(
@@ -115,6 +172,12 @@ class EdiOutput(DabOutput):
         """
         Write an AF packet to the output.
 
+        Send failures (e.g. ICMP port-unreachable surfacing as
+        ConnectionRefusedError on the connected socket while the
+        receiver is down) are logged and the packet is dropped; EDI is
+        datagram-based and a transient receiver outage must not stop
+        the multiplexer.
+
         Args:
             af_packet: AF packet to send
 
@@ -124,27 +187,98 @@ class EdiOutput(DabOutput):
         if not self._is_open or not self._socket:
             raise RuntimeError("EDI output not open")
 
-        # Assemble AF packet
-        af_data = af_packet.assemble()
-
         if self.enable_pft and self._pft_fragmenter:
             # Fragment with PFT
-            fragments = self._pft_fragmenter.fragment(af_data)
-
-            # Send each fragment
+            fragments = self._pft_fragmenter.fragment(af_packet.assemble())
+
+            # Pack all fragments back to back into the scratch buffer
+            # and send views into it, one allocation-free pass
+            total = sum(fragment.size() for fragment in fragments)
+            self._reserve_scratch(total)
+            views = []
+            offset = 0
             for fragment in fragments:
-                fragment_data = fragment.assemble()
-                self._socket.sendto(fragment_data, (self.dest_addr, self.dest_port))
-                self._fragments_sent += 1
-                self._bytes_sent += len(fragment_data)
-
+                end = fragment.pack_into(self._scratch, offset)
+                views.append(self._scratch_view[offset:end])
+                offset = end
+
+            try:
+                self._send_fragments(views)
+            except OSError as e:
+                self._on_send_error(e)
+                return
+            self._fragments_sent += len(views)
+            self._bytes_sent += offset
             self._packets_sent += 1
 
         else:
-            # Send AF packet directly
-            self._socket.sendto(af_data, (self.dest_addr, self.dest_port))
+            # Pack the AF packet in place and send a view of it
+            self._reserve_scratch(af_packet.size())
+            end = af_packet.pack_into(self._scratch)
+            try:
+                self._socket.send(self._scratch_view[:end])
+            except OSError as e:
+                self._on_send_error(e)
+                return
             self._packets_sent += 1
-            self._bytes_sent += len(af_data)
+            self._bytes_sent += end
+
+    def _on_send_error(self, error: OSError) -> None:
+        """Count a dropped packet and log it, rate-limited to 1/s."""
+        self._send_errors += 1
+        now = time.monotonic()
+        if now - self._last_send_error_log > 1.0:
+            self._last_send_error_log = now
+            logger.warning(
+                "EDI send failed, dropping packet",
+                dest=f"{self.dest_addr}:{self.dest_port}",
+                error=str(error),
+                send_errors=self._send_errors
+            )
+
+    def _reserve_scratch(self, size: int) -> None:
+        """Grow the transmit buffer if a packet needs more room."""
+        if size > len(self._scratch):
+            self._scratch = bytearray(size)
+            self._scratch_view = memoryview(self._scratch)
+
+    def _send_fragments(self, fragment_data: List[memoryview]) -> None:
+        """
+        Send packed PF fragments on the connected socket.
+
+        The views lie back to back in the transmit buffer. When UDP
+        generic segmentation offload is available, the whole span is
+        handed to the kernel in a single sendmsg with a UDP_SEGMENT
+        ancillary message; the kernel splits it back into per-fragment
+        datagrams, so a whole AF packet costs one syscall. Falls back
+        to one send() per fragment otherwise.
+
+        Args:
+            fragment_data: Packed PF fragments, in transmission order
+        """
+        segment_size = len(fragment_data[0])
+        if (_GSO_SUPPORTED and not self._gso_failed and len(fragment_data) > 1
+                and all(len(data) == segment_size for data in fragment_data[:-1])
+                and len(fragment_data[-1]) <= segment_size):
+            total = sum(len(data) for data in fragment_data)
+            try:
+                self._socket.sendmsg(
+                    [self._scratch_view[:total]],
+                    [(_SOL_UDP, _UDP_SEGMENT, struct.pack('H', segment_size))]
+                )
+                return
+            except OSError as e:
+                if e.errno in (errno.EINVAL, errno.EOPNOTSUPP, errno.ENOPROTOOPT):
+                    # Kernel without UDP GSO support; don't retry every
+                    # frame, but retry the fragments individually below
+                    self._gso_failed = True
+                else:
+                    # Transient network error; let write() drop the packet
+                    raise
+
+        send = self._socket.send
+        for data in fragment_data:
+            send(data)
 
     def is_open(self) -> bool:
         """Check if UDP socket is open."""
@@ -171,7 +305,7 @@ class EdiOutput(DabOutput):
             True if multicast (224.0.0.0 - 239.255.255.255)
         """
         try:
-            ip_int = struct.unpack('!I', socket.inet_aton(addr))[0]
+            ip_int = int.from_bytes(socket.inet_aton(addr), 'big')
             # Multicast range: 224.0.0.0/4 (0xE0000000 - 0xEFFFFFFF)
             return (ip_int & 0xF0000000) == 0xE0000000
         except:
@@ -188,5 +322,6 @@ class EdiOutput(DabOutput):
             'packets_sent': self._packets_sent,
             'bytes_sent': self._bytes_sent,
             'fragments_sent': self._fragments_sent,
+            'send_errors': self._send_errors,
             'pft_enabled': self.enable_pft
         }
@@ -9,6 +9,15 @@ from enum import Enum
 from typing import Optional
 from dabmux.output.base import DabOutput
 
+# Maximal RAW-mode padding; the view is sliced per frame, which hands
+# the writer a window into the constant instead of copying it
+_RAW_PADDING = b'\x55' * 6144
+_RAW_PADDING_VIEW = memoryview(_RAW_PADDING)
+
+# Precompiled header layouts, shared by every write
+_U32_LE = struct.Struct('<I')
+_U16_LE = struct.Struct('<H')
+
 
 class EtiFileType(Enum):
     """
@@ -39,6 +48,9 @@ class FileOutput(DabOutput):
         self._filename: str = ""
         self._file_type: EtiFileType = EtiFileType.FRAMED
         self._frame_count: int = 0
+        # Per-type write routine, bound once in open() so write() does
+        # not re-test the file type on every frame
+        self._write_impl = self._write_length_prefixed
 
     def open(self, name: str) -> None:
         """
@@ -58,13 +70,23 @@ class FileOutput(DabOutput):
         self._filename = self._parse_filename_and_type(name)
 
         try:
-            self._file = open(self._filename, 'wb')
+            # Large write buffer: frames are small (~kB) and arrive every
+            # 24ms, so per-frame write syscalls would dominate otherwise
+            self._file = open(self._filename, 'wb', buffering=1024 * 1024)
             self._is_open = True
             self._frame_count = 0
 
+            # Specialize the write path on the now-fixed file type
+            if self._file_type == EtiFileType.RAW:
+                self._write_impl = self._write_raw
+            else:
+                # FRAMED and STREAMED both prefix each frame with its
+                # length; FRAMED additionally gets its count on close()
+                self._write_impl = self._write_length_prefixed
+
             # For framed format, write initial frame count (will be updated later)
             if self._file_type == EtiFileType.FRAMED:
-                self._file.write(struct.pack('<I', 0))
+                self._file.write(_U32_LE.pack(0))
 
         except IOError as e:
             raise RuntimeError(f"Could not open output file {self._filename}: {e}")
@@ -121,54 +143,61 @@ class FileOutput(DabOutput):
         Raises:
             RuntimeError: On write error
         """
-        if not self._is_open or self._file is None:
+        # _file doubles as the open flag, so one check covers both
+        f = self._file
+        if f is None:
             raise RuntimeError("Output file is not open")
 
-        size = len(data)
         self._frame_count += 1
 
         try:
-            # Use .value comparison to avoid enum identity issues
-            if self._file_type.value == EtiFileType.FRAMED.value:
-                # Update frame count at beginning of file
-                current_pos = self._file.tell()
-                self._file.seek(0, 0)
-                self._file.write(struct.pack('<I', self._frame_count))
-                self._file.seek(current_pos, 0)
-
-                # Write frame length (2 bytes, little-endian)
-                self._file.write(struct.pack('<H', size))
+            # No per-frame flush: flush() only copies the Python buffer to
+            # the OS (it is not an fsync) and would defeat the buffering;
+            # close() flushes once at the end
+            self._write_impl(f, data)
+            return len(data)
 
-                # Write frame data
-                self._file.write(data)
-
-            elif self._file_type.value == EtiFileType.STREAMED.value:
-                # Write frame length (2 bytes, little-endian)
-                self._file.write(struct.pack('<H', size))
-
-                # Write frame data
-                self._file.write(data)
+        except IOError as e:
+            raise RuntimeError(f"Error writing to file: {e}")
 
-            elif self._file_type.value == EtiFileType.RAW.value:
-                # Write frame data
-                self._file.write(data)
+    def _write_length_prefixed(self, f, data: bytes) -> None:
+        """
+        Write a frame with a 2-byte little-endian length prefix.
 
-                # Pad to 6144 bytes with 0x55
-                padding_size = 6144 - size
-                if padding_size > 0:
-                    padding = bytes([0x55] * padding_size)
-                    self._file.write(padding)
+        Used for FRAMED and STREAMED files; for FRAMED, the frame count
+        header is only observed after close(), which writes the final
+        value once, so no seeking happens here.
+        """
+        f.write(_U16_LE.pack(len(data)))
+        f.write(data)
 
-            else:
-                raise RuntimeError("File type is not supported")
+    def _write_raw(self, f, data: bytes) -> None:
+        """
+        Write a frame padded to 6144 bytes with 0x55.
 
-            # Flush to ensure data is written
-            self._file.flush()
+        The frame and padding are written separately: both land in the
+        writer's buffer as plain C-level copies, so concatenating them
+        into a fresh bytes object first would only add an allocation
+        and a third copy of the frame.
+        """
+        f.write(data)
+        padding_size = 6144 - len(data)
+        if padding_size > 0:
+            f.write(_RAW_PADDING_VIEW[:padding_size])
 
-            return size
+    def checkpoint(self) -> None:
+        """
+        Persist the current frame count header mid-stream (framed only).
 
-        except IOError as e:
-            raise RuntimeError(f"Error writing to file: {e}")
+        Useful if the file must stay parseable after a crash; not called
+        from the write path.
+        """
+        if self._file is None or self._file_type != EtiFileType.FRAMED:
+            return
+        current_pos = self._file.tell()
+        self._file.seek(0, 0)
+        self._file.write(_U32_LE.pack(self._frame_count))
+        self._file.seek(current_pos, 0)
 
     def close(self) -> None:
         """Close the output file."""
@@ -177,7 +206,7 @@ class FileOutput(DabOutput):
                 # For framed format, ensure final frame count is written
                 if self._file_type == EtiFileType.FRAMED:
                     self._file.seek(0, 0)
-                    self._file.write(struct.pack('<I', self._frame_count))
+                    self._file.write(_U32_LE.pack(self._frame_count))
 
                 self._file.close()
             except IOError:
@@ -3,7 +3,12 @@ CRC calculation utilities for DAB multiplexing.
 
 This module provides CRC-8, CRC-16-CCITT, and CRC-32 calculations with
 pre-calculated tables matching the ODR-DabMux C++ implementation.
+
+The CRC-16 hot path is served by binascii.crc_hqx, the C implementation
+of the same CCITT algorithm shipped with CPython; a compiled extension
+of our own would add a build step without beating it.
 """
+import binascii
 
 # Pre-calculated CRC-8 table
 # Polynomial: 0x1C (x^8 + x^4 + x^3 + x^2 + 1)
@@ -170,6 +175,10 @@ def crc16(data: bytes, initial: int = 0xFFFF) -> int:
     """
     Calculate CRC-16-CCITT (polynomial 0x1021).
 
+    Delegates to binascii.crc_hqx, which implements the same
+    table-driven CCITT algorithm in C and is orders of magnitude faster
+    than the Python byte loop for the kB-scale EDI payloads.
+
     Args:
         data: Input bytes to calculate CRC over
         initial: Initial CRC value (default 0xFFFF)
@@ -177,10 +186,27 @@ def crc16(data: bytes, initial: int = 0xFFFF) -> int:
     Returns:
         16-bit CRC value
     """
-    crc = initial
-    for byte in data:
-        crc = ((crc << 8) ^ CRC16_TABLE[(crc >> 8) ^ byte]) & 0xFFFF
-    return crc
+    return binascii.crc_hqx(data, initial)
+
+
+def crc16_update(state: int, data: bytes) -> int:
+    """
+    Feed more data into a running CRC-16-CCITT calculation.
+
+    Lets callers checksum several buffers (e.g. a packet header and its
+    payload) without first concatenating them:
+
+        crc = crc16_update(0xFFFF, header)
+        crc = crc16_update(crc, payload)
+
+    Args:
+        state: CRC state so far (start with 0xFFFF)
+        data: Next chunk of input bytes
+
+    Returns:
+        Updated 16-bit CRC state
+    """
+    return binascii.crc_hqx(data, state)
 
 
 def crc32(data: bytes, initial: int = 0) -> int:
@@ -0,0 +1,117 @@
+"""
+Single-producer single-consumer byte ring buffer.
+
+This module provides a fixed-capacity ring of bytes shared between one
+producer thread and one consumer thread without locking, as used by the
+network inputs to hand received data to the frame reader.
+"""
+import array
+
+
+class SpscByteRing:
+    """
+    Fixed-capacity byte ring for one producer and one consumer thread.
+
+    The producer only advances the tail counter and the consumer only
+    advances the head counter, so no lock is needed: each side copies
+    its data first and then publishes with a single counter store,
+    which is atomic under the GIL. Counters increase monotonically and
+    are reduced modulo the capacity only for indexing, keeping the full
+    and empty states unambiguous.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initialize the ring.
+
+        Args:
+            capacity: Ring size in bytes
+
+        Raises:
+            ValueError: If capacity is not positive
+        """
+        if capacity <= 0:
+            raise ValueError("Ring capacity must be positive")
+        self._capacity = capacity
+        self._data = memoryview(bytearray(capacity))
+        # Head (consumer) and tail (producer) counters share one array
+        # so each publish is a single item store
+        self._counters = array.array('Q', [0, 0])
+
+    @property
+    def capacity(self) -> int:
+        """Ring size in bytes."""
+        return self._capacity
+
+    def __len__(self) -> int:
+        """Bytes currently buffered."""
+        return self._counters[1] - self._counters[0]
+
+    def free(self) -> int:
+        """Bytes of space currently available to the producer."""
+        return self._capacity - (self._counters[1] - self._counters[0])
+
+    def write_from(self, src) -> int:
+        """
+        Copy bytes from src into the ring (producer side).
+
+        Writes as much as currently fits, in at most two slice copies
+        when the span wraps. A short return value means the ring was
+        full and the remainder was not stored.
+
+        Args:
+            src: Bytes-like object to copy from
+
+        Returns:
+            Number of bytes copied
+        """
+        head = self._counters[0]
+        tail = self._counters[1]
+        count = min(len(src), self._capacity - (tail - head))
+        if count == 0:
+            return 0
+        view = memoryview(src)
+        start = tail % self._capacity
+        first = min(count, self._capacity - start)
+        self._data[start:start + first] = view[:first]
+        if first < count:
+            self._data[:count - first] = view[first:count]
+        # Publish after the copy so the consumer never sees bytes early
+        self._counters[1] = tail + count
+        return count
+
+    def read_into(self, dest) -> int:
+        """
+        Copy buffered bytes into dest (consumer side).
+
+        Reads up to len(dest) bytes, in at most two slice copies when
+        the span wraps.
+
+        Args:
+            dest: Writable bytes-like object to copy into
+
+        Returns:
+            Number of bytes copied
+        """
+        head = self._counters[0]
+        tail = self._counters[1]
+        count = min(len(dest), tail - head)
+        if count == 0:
+            return 0
+        view = memoryview(dest)
+        start = head % self._capacity
+        first = min(count, self._capacity - start)
+        view[:first] = self._data[start:start + first]
+        if first < count:
+            view[first:count] = self._data[:count - first]
+        self._counters[0] = head + count
+        return count
+
+    def clear(self) -> None:
+        """
+        Empty the ring by advancing the consumer counter.
+
+        Only safe while the consumer is otherwise idle; intended for
+        connection resets between frames.
+        """
+        self._counters[0] = self._counters[1]
@@ -9,7 +9,7 @@ from datetime import datetime
 from dabmux.core.eti import (
     EtiSync, EtiFC, EtiSTC, EtiEOH, EtiEOF, EtiTIST,
     EtiMNSCTime0, EtiMNSCTime1, EtiMNSCTime2, EtiMNSCTime3,
-    EtiFrame
+    EtiFrame, encode_stc_block, pack_mnsc_time
 )
 
 
@@ -155,6 +155,29 @@ class TestEtiSTC:
         assert unpacked.stl == stc.stl
 
 
+class TestEncodeStcBlock:
+    """Test the batch STC header encoder."""
+
+    def test_matches_per_header_pack(self) -> None:
+        """Test the block encoder matches EtiSTC.pack per header."""
+        headers = [
+            EtiSTC(scid=1, start_address=0, tpl=3, stl=42),
+            EtiSTC(scid=5, start_address=336, tpl=10, stl=84),
+            EtiSTC(scid=63, start_address=1023, tpl=63, stl=1023),
+        ]
+        buf = bytearray(4 * len(headers))
+        end = encode_stc_block(
+            buf, 0,
+            [h.scid for h in headers],
+            [h.start_address for h in headers],
+            [h.tpl for h in headers],
+            [h.stl for h in headers],
+        )
+
+        assert end == len(buf)
+        assert bytes(buf) == b''.join(h.pack() for h in headers)
+
+
 class TestEtiEOH:
     """Test ETI End of Header."""
 
@@ -273,6 +296,22 @@ class TestEtiMNSCTime:
         assert t3.year_unit == 4  # 2024-2000=24 -> unit=4
         assert t3.year_tens == 2  # 2024-2000=24 -> tens=2
 
+    def test_pack_mnsc_time_matches_field_concat(self) -> None:
+        """Fused 8-byte pack should match concatenating the four fields."""
+        dt = datetime(2024, 1, 15, 14, 37, 45)
+
+        t0 = EtiMNSCTime0()
+        t1 = EtiMNSCTime1()
+        t1.set_from_time(dt)
+        t2 = EtiMNSCTime2()
+        t2.set_from_time(dt)
+        t3 = EtiMNSCTime3()
+        t3.set_from_time(dt)
+
+        expected = t0.pack() + t1.pack() + t2.pack() + t3.pack()
+        assert pack_mnsc_time(dt) == expected
+        assert len(pack_mnsc_time(dt)) == 8
+
 
 class TestEtiFrame:
     """Test complete ETI frame."""
@@ -329,6 +368,28 @@ class TestEtiFrame:
         # FCT should be 0 (byte 4)
         assert data[4] == 0x00
 
+    def test_size_matches_packed_length(self) -> None:
+        """Test size() agrees with the packed frame length."""
+        frame = EtiFrame.create_empty(with_tist=True)
+        frame.stc_headers = [EtiSTC(scid=1, start_address=0, tpl=3, stl=84)]
+        frame.fc.nst = 1
+        frame.subchannel_data = b'\xAA' * 336
+
+        assert frame.size() == len(frame.pack())
+
+    def test_pack_into_matches_pack(self) -> None:
+        """Test pack_into writes the same bytes as pack()."""
+        frame = EtiFrame.create_empty(with_tist=True)
+        frame.stc_headers = [EtiSTC(scid=1, start_address=0, tpl=3, stl=84)]
+        frame.fc.nst = 1
+        frame.subchannel_data = b'\x55' * 336
+
+        buf = bytearray(frame.size() + 8)
+        end = frame.pack_into(buf, 4)
+
+        assert end == 4 + frame.size()
+        assert bytes(buf[4:end]) == frame.pack()
+
     def test_frame_with_transmission_modes(self) -> None:
         """Test creating frames with different transmission modes."""
         for mode in [1, 2, 3, 4]:
@@ -338,6 +399,49 @@ class TestEtiFrame:
             assert len(data) == 112
 
 
+class TestEtiFrameCompiledPacker:
+    """Test the specialized packer generated by compile_packer."""
+
+    def test_compiled_packer_matches_generic_pack(self) -> None:
+        """Test the generated packer is byte-identical to EtiFrame.pack()."""
+        from dabmux.utils.crc import crc16
+
+        stcs = [EtiSTC(scid=1, start_address=0, tpl=3, stl=42)]
+        pack_frame = EtiFrame.compile_packer(stcs, mode=1)
+
+        fic_data = bytes(range(96))
+        mst_data = b'\xA5' * (42 * 8)
+        mnsc = 0x1234
+
+        for fct in (0, 1, 255):
+            # Assemble the reference frame the way the mux does
+            fl = 1 + 96 // 4 + len(mst_data) // 4 + 1
+            fc = EtiFC(fct=fct, nst=1, ficf=1, mid=1, fp=fct % 8, fl=fl)
+            header = fc.pack() + stcs[0].pack() + mnsc.to_bytes(2, 'big')
+            frame = EtiFrame(
+                sync=EtiSync(fsync=0x073AB6 if fct % 2 == 0 else 0xF8C549),
+                fc=fc,
+                stc_headers=stcs,
+                eoh=EtiEOH(mnsc=mnsc, crc=crc16(header) ^ 0xFFFF),
+                fic_data=fic_data,
+                subchannel_data=mst_data,
+                eof=EtiEOF(crc=crc16(fic_data + mst_data) ^ 0xFFFF, rfu=0),
+            )
+
+            assert pack_frame(fct, fct % 8, fic_data, mst_data,
+                              mnsc=mnsc) == frame.pack()
+
+    def test_compiled_packer_rejects_wrong_sizes(self) -> None:
+        """Test the generated packer validates section lengths."""
+        pack_frame = EtiFrame.compile_packer(
+            [EtiSTC(scid=1, start_address=0, tpl=3, stl=42)])
+
+        with pytest.raises(ValueError):
+            pack_frame(0, 0, bytes(95), bytes(42 * 8))
+        with pytest.raises(ValueError):
+            pack_frame(0, 0, bytes(96), bytes(42 * 8 - 1))
+
+
 class TestEtiFrameStructureSizes:
     """Test that all ETI structures have correct sizes."""
 
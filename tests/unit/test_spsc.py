@@ -0,0 +1,108 @@
+"""
+Unit tests for the SPSC byte ring buffer.
+
+These tests verify capacity accounting, wrap-around copies, and the
+overflow behaviour relied on by the TCP input.
+"""
+import random
+
+import pytest
+from dabmux.utils.spsc import SpscByteRing
+
+
+class TestSpscByteRing:
+    """Test SpscByteRing basic operations."""
+
+    def test_invalid_capacity(self) -> None:
+        """Zero or negative capacity is rejected."""
+        with pytest.raises(ValueError):
+            SpscByteRing(0)
+        with pytest.raises(ValueError):
+            SpscByteRing(-1)
+
+    def test_empty_ring(self) -> None:
+        """A new ring is empty with full free space."""
+        ring = SpscByteRing(64)
+        assert len(ring) == 0
+        assert ring.free() == 64
+        assert ring.capacity == 64
+
+    def test_write_then_read(self) -> None:
+        """Written bytes come back in order."""
+        ring = SpscByteRing(64)
+        assert ring.write_from(b'hello') == 5
+        assert len(ring) == 5
+
+        out = bytearray(5)
+        assert ring.read_into(out) == 5
+        assert bytes(out) == b'hello'
+        assert len(ring) == 0
+
+    def test_read_from_empty(self) -> None:
+        """Reading an empty ring returns zero bytes."""
+        ring = SpscByteRing(8)
+        out = bytearray(4)
+        assert ring.read_into(out) == 0
+
+    def test_short_write_when_full(self) -> None:
+        """A full ring accepts only what fits; the rest is dropped."""
+        ring = SpscByteRing(8)
+        assert ring.write_from(b'x' * 10) == 8
+        assert ring.write_from(b'y') == 0
+        assert ring.free() == 0
+
+        out = bytearray(10)
+        assert ring.read_into(out) == 8
+        assert bytes(out[:8]) == b'x' * 8
+
+    def test_partial_read(self) -> None:
+        """A small destination drains the ring incrementally."""
+        ring = SpscByteRing(16)
+        ring.write_from(b'abcdef')
+
+        out = bytearray(4)
+        assert ring.read_into(out) == 4
+        assert bytes(out) == b'abcd'
+        assert ring.read_into(out) == 2
+        assert bytes(out[:2]) == b'ef'
+
+    def test_wrap_around(self) -> None:
+        """Data spanning the end of the buffer is copied correctly."""
+        ring = SpscByteRing(8)
+        ring.write_from(b'123456')
+        out = bytearray(6)
+        ring.read_into(out)
+
+        # Next write wraps past the end of the backing buffer
+        assert ring.write_from(b'ABCDEFG') == 7
+        out = bytearray(7)
+        assert ring.read_into(out) == 7
+        assert bytes(out) == b'ABCDEFG'
+
+    def test_clear(self) -> None:
+        """Clearing discards buffered bytes."""
+        ring = SpscByteRing(16)
+        ring.write_from(b'stale')
+        ring.clear()
+        assert len(ring) == 0
+        assert ring.free() == 16
+
+    def test_interleaved_stream(self) -> None:
+        """Random interleaved writes and reads preserve the byte stream."""
+        ring = SpscByteRing(17)
+        rnd = random.Random(42)
+        source = bytes(range(256)) * 8
+        produced = bytearray()
+        consumed = bytearray()
+        position = 0
+
+        while len(consumed) < 1000:
+            chunk = source[position:position + rnd.randint(1, 10)]
+            position += len(chunk)
+            produced += chunk[:ring.write_from(chunk)]
+
+            out = bytearray(rnd.randint(1, 12))
+            consumed += out[:ring.read_into(out)]
+
+        assert bytes(consumed) == bytes(produced[:len(consumed)])
+        assert len(ring) == len(produced) - len(consumed)